@@ -13,40 +13,837 @@ Example:
 """
 
 import argparse
-import csv
+import gzip
 import json
+import mmap
+import os
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from html import escape
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+try:
+    import ollama
+except ImportError:
+    # Optional: model discovery falls back to the HTTP API and the CLI
+    ollama = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: much faster JSON serialization when installed
+    orjson = None
+
+# One entry of an image_descriptions.txt file, starting just after "File: ".
+# Metadata lines may sit between Path and Description; the description runs
+# until a separator line or the end of the block, Timestamp line included,
+# as the original line-by-line scanner read it.
+_DESCRIPTION_ENTRY = re.compile(
+    r"(?P<filename>[^\n]*)\nPath: (?P<path>[^\n]*)\n.*?^Description: (?P<description>.*?)"
+    r"(?=^(?:File: |===|---)|\Z)",
+    re.S | re.M
+)
+
+# Sample descriptions in the HTML report: everything from the Description line
+# of an entry up to the next File line or separator. Runs on the raw bytes of
+# a memory-mapped file; only the captured groups are decoded.
+_SAMPLE_DESCRIPTION = re.compile(
+    rb"\nFile: (?P<filename>[^\n]*)\n(?:(?!File: )[^\n]*\n)*?Description: (?P<description>.*?)"
+    rb"(?=\n(?:File: |={16}|-{16})|\Z)",
+    re.S
+)
+
+# sanitize_name() in one C-level pass for ASCII names: ':', ' ' and '/' become
+# '_', other characters that aren't alphanumeric or '_-.' are dropped
+_NAME_TRANSLATION = str.maketrans(
+    {c: None for c in map(chr, range(128)) if not (c.isalnum() or c in '_-.')}
+)
+_NAME_TRANSLATION.update(str.maketrans(':/ ', '___'))
+
+# Sort key for fastest-first result listings
+_BY_DURATION = itemgetter('duration')
+
+# Image types listed in the HTML report's test image overview
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+
+# Workflow output directories that are identical for every model/prompt
+_SHARED_STEP_DIRS = ("extracted_frames", "converted_images")
+
+# Pause before starting a combination after failures, doubling per failure
+_BACKOFF_START = 1.0
+_BACKOFF_MAX = 30.0
+
+# Lines (and at most characters) of workflow output held in memory for error
+# messages and the failure report; results keep none of it, the full output
+# goes to stdout.log/stderr.log in the combination's directory
+_OUTPUT_TAIL_LINES = 200
+_OUTPUT_TAIL_CHARS = 4096
+
+# created_files keys in the order of the CSV report's trailing columns
+_CSV_FILE_KEYS = (
+    'descriptions', 'html_reports', 'extracted_frames', 'converted_images', 'logs',
+    'description_file_size', 'html_file_count', 'frame_count', 'converted_count'
+)
+
+# Write buffer for the text reports: large enough that each report reaches
+# the disk (or a network share) in one or two writes
+_REPORT_BUFFER = 1 << 20
+
+# One JSON line per finished combination; lets an interrupted run resume
+_CHECKPOINT_FILE = "results.jsonl"
+
+# Written into a combination's directory when it succeeds, holding its result;
+# a later run into the same directory reuses it instead of re-running
+_DONE_FILE = ".done"
+
+_CSV_HEADER = (
+    'Model', 'Prompt', 'Success', 'Duration_Seconds', 'Error_Message',
+    'Output_Directory', 'Descriptions_Created', 'HTML_Created',
+    'Frames_Extracted', 'Images_Converted', 'Logs_Created',
+    'Description_File_Size', 'HTML_File_Count', 'Frame_Count', 'Converted_Count'
+)
+
+
+@lru_cache(maxsize=None)
+def _sanitize_name(name: str) -> str:
+    """
+    Filesystem-safe form of a model or prompt name
+
+    Cached: names come from the small, fixed set of models and prompt styles.
+    """
+    if not name:
+        return "unknown"
+    safe_name = name.translate(_NAME_TRANSLATION)
+    if not safe_name.isascii():
+        # The table only covers ASCII; filter the rest character by character
+        safe_name = ''.join(c for c in safe_name if c.isalnum() or c in '_-.')
+    return safe_name
+
+
+def _model_names(models) -> List[str]:
+    """Model names from an Ollama model listing (API dicts or client objects)"""
+    return [name for name in (m.get('model') or m.get('name') for m in models) if name]
+
+
+# Characters that make a CSV field need quoting
+_CSV_SPECIAL = re.compile(r'[",\r\n]')
+
+
+def _csv_field(value: Any) -> str:
+    """Format one CSV field the way csv.writer's default dialect does"""
+    if value is None:
+        return ''
+    text = str(value)
+    if _CSV_SPECIAL.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _csv_line(fields) -> str:
+    """
+    Format a CSV row
+
+    Same output as csv.writer (minimal quoting, CRLF line ends) without
+    going through the csv module; the report's fields are mostly plain
+    names and numbers.
+    """
+    return ",".join(map(_csv_field, fields)) + "\r\n"
+
+
+def _csv_row(result: Dict[str, Any]) -> tuple:
+    """One CSV report row for a combination result"""
+    return (
+        result['model'],
+        result['prompt'],
+        result['success'],
+        result['duration'],
+        result['error_message'] or '',
+        result['output_dir'],
+        *(result['created_files'][key] for key in _CSV_FILE_KEYS)
+    )
+
+
+def _checkpoint_line(result: Dict[str, Any]) -> str:
+    """Serialize a combination result as one results.jsonl line"""
+    record = dict(result,
+                  start_time=result['start_time'].isoformat(),
+                  end_time=result['end_time'].isoformat())
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _parse_checkpoint_line(line: str) -> Dict[str, Any]:
+    """Inverse of _checkpoint_line; raises ValueError on a damaged line"""
+    result = json.loads(line)
+    result['start_time'] = datetime.fromisoformat(result['start_time'])
+    result['end_time'] = datetime.fromisoformat(result['end_time'])
+    return result
+
+
+def _ollama_base_url(host: Optional[str]) -> str:
+    """
+    Base URL of the Ollama server from an OLLAMA_HOST value
+
+    Read the way the ollama client reads it: a bare host ("myhost",
+    "0.0.0.0") gets http:// and port 11434; an explicit http:// or https://
+    URL without a port uses that scheme's default port.
+    """
+    host, port = host or '', 11434
+    scheme, _, hostport = host.partition('://')
+    if not hostport:
+        scheme, hostport = 'http', host
+    elif scheme == 'http':
+        port = 80
+    elif scheme == 'https':
+        port = 443
+
+    split = urllib.parse.urlsplit(f'{scheme}://{hostport}')
+    hostname = split.hostname or '127.0.0.1'
+    if ':' in hostname:
+        hostname = f'[{hostname}]'  # IPv6 literal
+    try:
+        port = split.port or port
+    except ValueError:
+        pass  # Unparseable port (e.g. a bare IPv6 address); keep the default
+    url = f'{scheme}://{hostname}:{port}'
+    path = split.path.strip('/')
+    return f'{url}/{path}' if path else url
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as jf:
+            json.dump(data, jf, indent=2)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _count_files(directory: Path, suffixes: tuple) -> Optional[int]:
+    """
+    Count files in a directory whose names end with one of suffixes
+
+    Reads the directory once with os.scandir. Returns None if the directory
+    does not exist.
+    """
+    count = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                    count += 1
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return count
+
+
+def _link_shared_dir(source: Path, target: Path) -> None:
+    """
+    Make a shared step output directory visible inside a combination
+
+    Symlinks target to source, or copies it where symlinks are not
+    permitted (e.g. Windows without developer mode).
+    """
+    if target.exists() or not source.is_dir():
+        return
+    try:
+        target.symlink_to(source, target_is_directory=True)
+    except OSError:
+        shutil.copytree(source, target)
+
+
+def _drain(stream, log_path: Path, tail: deque) -> None:
+    """Copy a subprocess pipe to a log file, keeping only its last lines"""
+    with stream:
+        try:
+            with open(log_path, 'w', encoding='utf-8') as log:
+                for line in stream:
+                    log.write(line)
+                    tail.append(line)
+        except Exception as e:
+            tail.append(f"[output capture failed: {e}]\n")
+            # Keep reading to EOF regardless: a pipe nobody drains fills up
+            # and blocks the child until the timeout
+            while stream.buffer.read(1 << 16):
+                pass
+
+
+# Workflow processes still running, so an interrupt can stop them; once
+# _stop_processes() has run no new ones are allowed to start
+_processes = set()
+_processes_lock = threading.Lock()
+_stopping = False
+
+
+def _stop_processes() -> None:
+    """Terminate every running workflow process and refuse to start more"""
+    global _stopping
+    with _processes_lock:
+        _stopping = True
+        procs = list(_processes)
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _run_streamed(cmd: List[str], cwd: Path, log_dir: Path, timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a command, streaming its output to disk instead of buffering it
+
+    Args:
+        cmd: Command to run
+        cwd: Working directory for the command
+        log_dir: Directory for stdout.log and stderr.log
+        timeout: Seconds before the process is killed
+
+    Returns:
+        CompletedProcess whose stdout/stderr hold the end of each stream:
+        the last _OUTPUT_TAIL_LINES lines, cut to _OUTPUT_TAIL_CHARS
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran longer than timeout
+    """
+    # The workflows print UTF-8 (emoji included) whatever the console
+    # codepage; decode it as such rather than with the locale codec
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, encoding='utf-8', errors='replace', cwd=str(cwd))
+    with _processes_lock:
+        _processes.add(proc)
+        if _stopping:
+            proc.terminate()
+    stdout_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, log_dir / "stdout.log", stdout_tail), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, log_dir / "stderr.log", stderr_tail), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        # Grandchildren may still hold the pipes open; don't wait on them
+        for reader in readers:
+            reader.join(timeout=5)
+        raise
+    finally:
+        with _processes_lock:
+            _processes.discard(proc)
+
+    for reader in readers:
+        reader.join()
+    return subprocess.CompletedProcess(cmd, proc.returncode,
+                                       "".join(stdout_tail)[-_OUTPUT_TAIL_CHARS:],
+                                       "".join(stderr_tail)[-_OUTPUT_TAIL_CHARS:])
+
+
+def _read_log_tail(log_path: Path) -> str:
+    """Last _OUTPUT_TAIL_CHARS characters of a combination log, '' if missing"""
+    try:
+        with open(log_path, 'rb') as log:
+            log.seek(0, os.SEEK_END)
+            # Up to 4 bytes per character in UTF-8
+            log.seek(max(0, log.tell() - 4 * _OUTPUT_TAIL_CHARS))
+            data = log.read()
+    except OSError:
+        return ''
+    return data.decode('utf-8', errors='replace')[-_OUTPUT_TAIL_CHARS:]
+
+
+# Static head of the visual HTML report: document head and stylesheet
+_HTML_PREAMBLE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ImageDescriber Comprehensive Test Results</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1, h2, h3, h4, h5 {
+            color: #333;
+        }
+        h4 {
+            color: #212529;
+            font-size: 1.1em;
+            margin: 20px 0 10px 0;
+            border-bottom: 1px solid #e9ecef;
+            padding-bottom: 5px;
+        }
+        h5 {
+            color: #212529;
+            font-size: 1em;
+            margin: 15px 0 8px 0;
+            font-weight: 600;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            padding-bottom: 20px;
+            border-bottom: 2px solid #e0e0e0;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 40px;
+        }
+        .stat-card {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border-left: 4px solid #0056b3;
+        }
+        .stat-number {
+            font-size: 2em;
+            font-weight: bold;
+            color: #0056b3;
+        }
+        .stat-label {
+            color: #212529;
+            font-size: 0.9em;
+        }
+        .prompt-section {
+            margin-bottom: 50px;
+            border: 1px solid #e0e0e0;
+            border-radius: 8px;
+            overflow: hidden;
+        }
+        .prompt-header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            font-size: 1.3em;
+            font-weight: bold;
+        }
+        .model-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+            padding: 20px;
+        }
+        .model-card {
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            overflow: hidden;
+            background: white;
+        }
+        .model-header {
+            background: #f8f9fa;
+            padding: 15px;
+            font-weight: bold;
+            color: #333;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .description-header {
+            color: #212529;
+            font-size: 1em;
+            font-weight: 600;
+            margin: 15px 0 5px 0;
+            padding: 0;
+        }
+        .model-content {
+            padding: 15px;
+        }
+        .timing-info {
+            font-size: 0.9em;
+            color: #495057;
+            margin-bottom: 10px;
+        }
+        .description {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            border-left: 3px solid #28a745;
+            font-style: italic;
+            margin-bottom: 15px;
+        }
+        .image-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 10px;
+            margin-top: 15px;
+        }
+        .image-item {
+            text-align: center;
+        }
+        .image-item img {
+            max-width: 100%;
+            height: 120px;
+            object-fit: cover;
+            border-radius: 5px;
+            border: 1px solid #ddd;
+        }
+        .image-name {
+            font-size: 0.8em;
+            color: #495057;
+            margin-top: 5px;
+        }
+        .toc {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+        }
+        .toc h3 {
+            margin-top: 0;
+        }
+        .toc ul {
+            list-style: none;
+            padding: 0;
+        }
+        .toc li {
+            margin: 8px 0;
+        }
+        .toc a {
+            color: #0056b3;
+            text-decoration: none;
+            padding: 5px 10px;
+            border-radius: 4px;
+            transition: background-color 0.2s;
+        }
+        .toc a:hover {
+            background-color: #e3f2fd;
+        }
+        .no-results {
+            text-align: center;
+            color: #495057;
+            font-style: italic;
+            padding: 40px;
+        }
+    </style>
+</head>
+<body>
+"""
+
+# Report header, summary cards and the start of the table of contents;
+# filled in with str.format_map()
+_HTML_HEADER_TEMPLATE = """    <div class="container">
+        <div class="header">
+            <h1>ImageDescriber Comprehensive Test Results</h1>
+            <p><strong>Test Date:</strong> {start_time:%Y-%m-%d %H:%M:%S}</p>
+            <p><strong>Image Path:</strong> {image_path}</p>
+        </div>
+
+        <div class="summary">
+            <div class="stat-card">
+                <div class="stat-number">{total}</div>
+                <div class="stat-label">Total Combinations Tested</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{successful}</div>
+                <div class="stat-label">Successful Tests</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{failed}</div>
+                <div class="stat-label">Failed Tests</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{success_rate:.1f}%</div>
+                <div class="stat-label">Success Rate</div>
+            </div>
+        </div>
+
+        <div class="toc">
+            <h2>Table of Contents</h2>
+            <ul>"""
+
+
+# Per-section fragments of the HTML report, filled in with str.format()
+_TOC_ITEM = '                <li><a href="#prompt-{anchor}">{title} Style ({count} models)</a></li>\n'
+
+_PROMPT_SECTION = """
+        <div class="prompt-section" id="prompt-{anchor}">
+            <h2 class="prompt-header">
+                {title} Style - {count} Models Tested
+            </h2>
+            <div class="model-grid">{cards}
+            </div>
+        </div>"""
+
+_IMAGES_SECTION = """
+        <div class="prompt-section">
+            <h2 class="prompt-header">
+                Test Images Used ({count} images)
+            </h2>
+            <div style="padding: 20px;">
+                <h3>Image Files Overview</h3>
+                <div class="image-grid">{items}
+                </div>
+            </div>
+        </div>"""
+
+_HTML_FOOTER_TEMPLATE = """
+
+        <div style="text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #e0e0e0; color: #495057;">
+            <p>Generated by ImageDescriber Comprehensive Testing Tool</p>
+            <p>Total Runtime: {runtime} | {image_count} test images processed</p>
+        </div>
+
+    </div>
+</body>
+</html>"""
+
+# Per-model fragments of the HTML report, filled in with str.format()
+_MODEL_CARD_HEADER = """
+                <div class="model-card">
+                    <h3 class="model-header">
+                        {model}
+                    </h3>
+                    <div class="model-content">
+                        <h4>Performance Details</h4>
+                        <div class="timing-info">
+                            Processing Time: {duration:.1f} seconds
+                        </div>"""
+
+_DESCRIPTION_ITEM = """
+                        <h5 class="description-header">{filename}</h5>
+                        <div class="description">
+                            {description}
+                        </div>"""
+
+_SUMMARY_LINE = """
+                        <h4>Summary</h4>
+                        <div style="text-align: center; color: #495057; font-style: italic; margin-top: 10px;">
+                            Total: {count} images described
+                        </div>"""
+
+_IMAGE_ITEM = """
+                    <div class="image-item">
+                        <div class="image-name">{name}</div>
+                    </div>"""
+
+
+@lru_cache(maxsize=4096)
+def _cached_escape(text: str) -> str:
+    return escape(text, quote=False)
+
+
+def _escape_text(text: str) -> str:
+    """HTML-escape report text, memoizing short strings seen before"""
+    if len(text) < 4096:
+        return _cached_escape(text)
+    return escape(text, quote=False)
+
+
+def _render_card(result: Dict[str, Any], descriptions: Dict[str, str]) -> str:
+    """
+    Render one model card of the HTML report
+
+    Args:
+        result: Combination result
+        descriptions: Sample descriptions for the combination, by file name
+
+    Returns:
+        HTML for the card
+    """
+    parts = [_MODEL_CARD_HEADER.format(model=result['model'], duration=result['duration'])]
+
+    # Show sample descriptions
+    if descriptions:
+        parts.append("""
+                        <h4>Generated Descriptions</h4>""")
+        # Show the first 3 descriptions as examples
+        for filename, desc in islice(descriptions.items(), 3):
+            if desc:
+                parts.append(_DESCRIPTION_ITEM.format(
+                    filename=_escape_text(filename),
+                    description=_escape_text(desc)
+                ))
+
+        parts.append(_SUMMARY_LINE.format(count=len(descriptions)))
+    else:
+        parts.append("""
+                        <h4>Generated Descriptions</h4>
+                        <div class="description" style="border-left-color: #dc3545;">
+                            No descriptions found or failed to parse description file.
+                        </div>""")
+
+    parts.append("""
+                    </div>
+                </div>""")
+    return "".join(parts)
+
+
+def _read_sample_descriptions(desc_file: str) -> Dict[str, str]:
+    """
+    Read the descriptions from an image_descriptions.txt file
+
+    Entries look like:
+        File: filename.jpg
+        Model: model_name
+        Prompt Style: style
+        Description: actual description
+
+    Returns:
+        Dictionary mapping file names to their descriptions; empty if the
+        file is missing or empty
+    """
+    try:
+        df = open(desc_file, 'rb')
+    except FileNotFoundError:
+        return {}
+
+    descriptions = {}
+    with df:
+        if os.fstat(df.fileno()).st_size == 0:
+            return descriptions  # mmap can't map an empty file
+        with mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _SAMPLE_DESCRIPTION.finditer(mm):
+                description = match['description'].decode('utf-8').strip()
+                if description:
+                    descriptions[match['filename'].decode('utf-8').strip()] = description
+    return descriptions
+
 
 class ComprehensiveTester:
     """Comprehensive testing class for ImageDescriber workflow"""
 
-    def __init__(self, image_path: str, output_base: Optional[str] = None):
+    def __init__(self, image_path: str, output_base: Optional[str] = None, gzip_html: bool = False,
+                 jobs: Optional[int] = None, force: bool = False):
         """
         Initialize the comprehensive tester
 
         Args:
             image_path: Path to directory containing test images
             output_base: Optional custom output directory
+            gzip_html: Write the visual HTML report gzip-compressed
+            jobs: Number of combinations to run at once (default: 1)
+            force: Re-run every combination, ignoring results saved by an
+                earlier run into the same output directory
         """
         self.image_path = Path(image_path)
+        self.gzip_html = gzip_html
+        self.jobs = jobs
+        self.force = force
         if not self.image_path.exists():
             raise ValueError(f"Image path does not exist: {image_path}")
+        # Workflows run from the scripts directory, so they get absolute
+        # paths; resolve once here rather than for every combination
+        self.abs_image_path = self.image_path.resolve()
+
+        # Create timestamped output directory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if output_base:
+            self.output_base = Path(output_base).resolve()
+        else:
+            self.output_base = Path(f"comprehensive_test_{timestamp}").resolve()
 
-    def compile_descriptions_to_json(self, output_json_path: str):
+        self.output_base.mkdir(parents=True, exist_ok=True)
+
+        # Determine script directory - workflow.py should be in scripts/ subdirectory
+        self.script_dir = Path(__file__).parent / "scripts"
+        if not self.script_dir.exists():
+            # If scripts directory doesn't exist, assume we're running from project root
+            self.script_dir = Path(__file__).parent
+
+        # Parse the describer config once; a missing or broken file is
+        # reported when the prompt styles are needed
+        self.config_path = self.script_dir / "image_describer_config.json"
+        if not self.config_path.exists():
+            # Try current directory
+            self.config_path = Path("image_describer_config.json")
+        self._config = None
+        self._config_error = None
+        try:
+            self._config = _read_json(self.config_path)
+        except Exception as e:
+            self._config_error = e
+
+        # Test results storage
+        self.results = []
+        self.start_time = None
+        self.end_time = None
+        self._summary = None  # Filled in by _summarize() once all runs finish
+        self.shared_inputs = None  # Set by prepare_shared_inputs()
+        self.env_cache = None  # Set by write_env_cache()
+        self._models = None  # Set by discover_models()
+        self._prompt_styles = None  # Set by discover_prompt_styles()
+        self._csv_streamed = False  # CSV rows written as combinations finish
+
+        # Statistics: one entry per result in parallel lists, with model and
+        # prompt names interned to integer ids; aggregated with NumPy when
+        # the statistics report is written
+        self._durations = []
+        self._successes = []
+        self._model_ids = []
+        self._prompt_ids = []
+        self._model_idx = {}  # Model name -> id
+        self._prompt_idx = {}  # Prompt style -> id
+        self._stats_lock = threading.Lock()  # Combinations finish out of order
+
+        # Models already loaded into Ollama for this run, and one lock per
+        # model so a load only holds up combinations waiting for that model
+        self._warm_lock = threading.Lock()  # Guards _warm_locks
+        self._warm_locks = defaultdict(threading.Lock)
+        self._warm_models = set()
+        # Seconds to wait before the next combination; grows while
+        # combinations keep failing (e.g. an overloaded Ollama server)
+        self._backoff = 0.0
+        self.ollama_host = _ollama_base_url(os.environ.get("OLLAMA_HOST"))
+
+        print("="*80)
+        print("ImageDescriber Comprehensive Testing")
+        print("="*80)
+        print(f"Image Path: {self.image_path}")
+        print(f"Output Directory: {self.output_base}")
+        print(f"Start Time: {datetime.now()}")
+        print("="*80)
+
+    def compile_descriptions_to_json(self, output_json_path: str, per_image: bool = False):
         """
         Compile all image_descriptions.txt files into a single JSON file matching the structure of p004-002.json.
 
         Args:
-            output_json_path: Path to output JSON file
+            output_json_path: Path to output JSON file, or a directory to
+                write manifest.json into
+            per_image: Also write one <image>.json per image when
+                output_json_path is a directory
         """
-        import re
-
         # Find all image_descriptions.txt files in custom_results/*/descriptions/
         base_dir = Path(__file__).parent / "custom_results"
         desc_files = list(base_dir.glob("*_latest_*/descriptions/image_descriptions.txt"))
@@ -55,66 +852,36 @@ class ComprehensiveTester:
         compiled = {}
 
         for desc_file in desc_files:
-            # Extract model and style from path
-            match = re.search(r"custom_results/([^_]+)_latest_([^/]+)/descriptions/image_descriptions.txt", str(desc_file))
-            if not match:
+            # Extract model and style from the "<model>_latest_<style>" directory
+            model, _, style = desc_file.parent.parent.name.partition("_latest_")
+            if not style:
                 continue
-            model = match.group(1)
-            style = match.group(2)
-
-            with open(desc_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Parse each description block
-            i = 0
-            while i < len(lines):
-                if lines[i].startswith("File: "):
-                    filename = lines[i].strip().split("File: ")[1]
-                    file_path = None
-                    description = ""
-                    # Find Path line
-                    j = i + 1
-                    while j < len(lines) and not lines[j].startswith("Path: "):
-                        j += 1
-                    if j < len(lines):
-                        file_path = lines[j].strip().split("Path: ")[1]
-                    # Find Model line
-                    while j < len(lines) and not lines[j].startswith("Model: "):
-                        j += 1
-                    # Find Prompt Style line
-                    while j < len(lines) and not lines[j].startswith("Prompt Style: "):
-                        j += 1
-                    # Find Description line
-                    while j < len(lines) and not lines[j].startswith("Description: "):
-                        j += 1
-                    if j < len(lines):
-                        desc_lines = [lines[j].strip()[13:]]
-                        k = j + 1
-                        while k < len(lines) and not (
-                            lines[k].startswith("File: ") or
-                            lines[k].startswith("===") or
-                            lines[k].startswith("---")
-                        ):
-                            desc_lines.append(lines[k].strip())
-                            k += 1
-                        description = "\n".join(desc_lines).strip()
-                        i = k
-                    else:
-                        i += 1
-
-                    if file_path:
-                        if file_path not in compiled:
-                            compiled[file_path] = {}
-                        if style not in compiled[file_path]:
-                            compiled[file_path][style] = []
-                        compiled[file_path][style].append({
-                            "model": model,
-                            "description": description
-                        })
-                else:
-                    i += 1
-
-        # Write out JSON files for each image
+
+            text = "\n" + desc_file.read_text(encoding="utf-8")
+
+            # One block per "File: " entry; the leading header block is dropped.
+            # Blocks are matched in place between offsets rather than split out.
+            start = text.find("\nFile: ")
+            while start != -1:
+                end = text.find("\nFile: ", start + 1)
+                entry = _DESCRIPTION_ENTRY.match(text, start + 7, len(text) if end == -1 else end)
+                start = end
+                if not entry:
+                    continue
+                file_path = entry.group("path").strip()
+                # Each line trimmed, as the original scanner did
+                description = "\n".join(
+                    line.strip() for line in entry.group("description").split("\n")
+                ).strip()
+
+                if file_path:
+                    compiled.setdefault(file_path, {}).setdefault(style, []).append({
+                        "model": model,
+                        "description": description
+                    })
+
+        # Build one record per image
+        records = []
         for file_path, styles in compiled.items():
             out = {
                 "file_path": file_path,
@@ -125,51 +892,57 @@ class ComprehensiveTester:
                     "style": style,
                     "models": models
                 })
-            # Output file name based on image file name
-            img_name = Path(file_path).stem
-            json_path = Path(output_json_path)
-            if json_path.is_dir():
-                out_file = json_path / f"{img_name}.json"
-            else:
-                out_file = json_path
-            with open(out_file, "w", encoding="utf-8") as jf:
-                json.dump(out, jf, indent=2)
-
-        # Create timestamped output directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if output_base:
-            self.output_base = Path(output_base)
+            records.append(out)
+
+        json_path = Path(output_json_path)
+        if json_path.is_dir():
+            # All images go into a single manifest; per-image files are opt-in
+            _write_json(json_path / "manifest.json", records)
+            if per_image:
+                for out in records:
+                    # Output file name based on image file name
+                    img_name = Path(out["file_path"]).stem
+                    _write_json(json_path / f"{img_name}.json", out)
         else:
-            self.output_base = Path(f"comprehensive_test_{timestamp}")
+            _write_json(json_path, records)
 
-        self.output_base.mkdir(parents=True, exist_ok=True)
+    def discover_models(self) -> List[str]:
+        """Discover all available Ollama models; asks Ollama once per tester"""
+        if self._models is not None:
+            return self._models
 
-        # Determine script directory - workflow.py should be in scripts/ subdirectory
-        self.script_dir = Path(__file__).parent / "scripts"
-        if not self.script_dir.exists():
-            # If scripts directory doesn't exist, assume we're running from project root
-            self.script_dir = Path(__file__).parent
+        print("\n=== STEP 1: Discovering Ollama models ===")
 
-        # Test results storage
-        self.results = []
-        self.start_time = None
-        self.end_time = None
+        models = self._list_models()
+        for model_name in models:
+            print(f"Found model: {model_name}")
 
-        # Statistics
-        self.model_stats = {}  # Per-model statistics
-        self.prompt_stats = {}  # Per-prompt statistics
+        if not models:
+            raise ValueError("No models found in Ollama")
 
-        print("="*80)
-        print("ImageDescriber Comprehensive Testing")
-        print("="*80)
-        print(f"Image Path: {self.image_path}")
-        print(f"Output Directory: {self.output_base}")
-        print(f"Start Time: {datetime.now()}")
-        print("="*80)
+        print(f"\nDiscovered {len(models)} models")
+        self._models = models
+        return models
 
-    def discover_models(self) -> List[str]:
-        """Discover all available Ollama models"""
-        print("\n=== STEP 1: Discovering Ollama models ===")
+    def _list_models(self) -> List[str]:
+        """
+        Names of the installed Ollama models
+
+        Asks the server through the ollama package, then the HTTP API
+        directly, and only falls back to parsing `ollama list` output if
+        neither answers.
+        """
+        if ollama is not None:
+            try:
+                return _model_names(ollama.list()['models'])
+            except Exception:
+                pass
+
+        try:
+            with urllib.request.urlopen(f"{self.ollama_host}/api/tags", timeout=30) as response:
+                return _model_names(json.load(response)['models'])
+        except (urllib.error.URLError, OSError, ValueError, KeyError):
+            pass
 
         try:
             result = subprocess.run(
@@ -178,44 +951,35 @@ class ComprehensiveTester:
                 text=True,
                 check=True
             )
-
-            # Parse models from output (skip header)
-            models = []
-            for line in result.stdout.strip().split('\n')[1:]:
-                if line.strip():
-                    model_name = line.split()[0]
-                    if model_name:
-                        models.append(model_name)
-                        print(f"Found model: {model_name}")
-
-            if not models:
-                raise ValueError("No models found in Ollama")
-
-            print(f"\nDiscovered {len(models)} models")
-            return models
-
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to query Ollama: {e}")
         except FileNotFoundError:
             raise RuntimeError("Ollama not found. Is Ollama installed and in PATH?")
 
+        # Parse models from output (skip header)
+        models = []
+        for line in result.stdout.strip().split('\n')[1:]:
+            if line.strip():
+                model_name = line.split()[0]
+                if model_name:
+                    models.append(model_name)
+        return models
+
     def discover_prompt_styles(self) -> List[str]:
-        """Discover all available prompt styles from config"""
-        print("\n=== STEP 2: Discovering prompt styles ===")
+        """Discover all available prompt styles from config; read once per tester"""
+        if self._prompt_styles is not None:
+            return self._prompt_styles
 
-        config_path = self.script_dir / "image_describer_config.json"
-        if not config_path.exists():
-            # Try current directory
-            config_path = Path("image_describer_config.json")
+        print("\n=== STEP 2: Discovering prompt styles ===")
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        if isinstance(self._config_error, FileNotFoundError):
+            raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if self._config_error is not None:
+                raise self._config_error
 
-            prompt_styles = list(config.get('prompt_variations', {}).keys())
+            prompt_styles = list(self._config.get('prompt_variations', {}).keys())
 
             for style in prompt_styles:
                 print(f"Found prompt style: {style}")
@@ -224,20 +988,132 @@ class ComprehensiveTester:
                 raise ValueError("No prompt styles found in config file")
 
             print(f"\nDiscovered {len(prompt_styles)} prompt styles")
+            self._prompt_styles = prompt_styles
             return prompt_styles
 
         except Exception as e:
             raise RuntimeError(f"Failed to read config file: {e}")
 
+    @cached_property
+    def image_files(self) -> List[Path]:
+        """Test images in the image directory, sorted; read from disk once per run"""
+        with os.scandir(self.image_path) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS and entry.is_file()
+            )
+
+    def write_env_cache(self, models: List[str], prompts: List[str]) -> Path:
+        """
+        Save the discovered models and prompt styles for the child workflows
+
+        Each combination's image_describer.py reads the model list from this
+        file instead of querying Ollama again before it starts describing.
+        """
+        self.output_base.mkdir(parents=True, exist_ok=True)
+        self.env_cache = self.output_base / "_env_cache.json"
+        _write_json(self.env_cache, {"models": models, "prompt_styles": prompts})
+        return self.env_cache
+
     def sanitize_name(self, name: str) -> str:
         """Convert model/prompt names to filesystem-safe strings"""
-        if not name:
-            return "unknown"
-        # Replace problematic characters
-        safe_name = name.replace(':', '_').replace(' ', '_').replace('/', '_')
-        # Remove any other problematic characters
-        safe_name = ''.join(c for c in safe_name if c.isalnum() or c in '_-.')
-        return safe_name
+        return _sanitize_name(name)
+
+    def _ollama_api(self, endpoint: str, payload: Dict[str, Any], timeout: float = 600) -> Optional[Dict[str, Any]]:
+        """
+        POST a JSON payload to the Ollama HTTP API
+
+        Args:
+            endpoint: API path, e.g. "/api/generate"
+            payload: JSON request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded JSON response, or None if the request failed
+        """
+        request = urllib.request.Request(
+            self.ollama_host.rstrip("/") + endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read() or b"{}")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            print(f"Warning: Ollama API {endpoint} failed: {e}")
+            return None
+
+    def warm_model(self, model: str) -> None:
+        """
+        Load a model once and keep it resident for all of its prompt styles
+
+        The first combination for each model loads it with an empty prompt and
+        a long keep_alive; later combinations for the same model wait for that
+        and then skip the load. If the load fails, the next combination for
+        the model tries again.
+        """
+        if model in self._warm_models:
+            return
+        with self._warm_lock:
+            model_lock = self._warm_locks[model]
+        with model_lock:
+            if model in self._warm_models:
+                return
+            print(f"Loading model {model} into Ollama...")
+            if self._ollama_api("/api/generate", {"model": model, "prompt": "", "keep_alive": "30m"}) is not None:
+                self._warm_models.add(model)
+
+    def prefetch_model(self, model: str) -> None:
+        """Start loading a model in the background, ahead of its first combination"""
+        threading.Thread(target=self.warm_model, args=(model,), daemon=True).start()
+
+    def evict_model(self, model: str) -> None:
+        """Unload a model from Ollama once all of its combinations are done"""
+        if self._ollama_api("/api/generate", {"model": model, "keep_alive": 0}, timeout=60) is not None:
+            print(f"Unloaded model {model} from Ollama")
+
+    def prepare_shared_inputs(self) -> Optional[Path]:
+        """
+        Run video extraction and image conversion once for all combinations
+
+        Returns:
+            Directory holding extracted_frames/ and converted_images/, or None
+            if the preparation run failed (each combination then runs the
+            full workflow itself)
+        """
+        shared_dir = self.output_base / "_shared_inputs"
+        cmd = [
+            sys.executable, str(self.script_dir / "workflow.py"),
+            str(self.abs_image_path),
+            "--output-dir", str(shared_dir),
+            "--steps", "video,convert"
+        ]
+
+        print("\n=== Preparing shared inputs (video extraction, image conversion) ===")
+        print(f"Running: {' '.join(cmd)}")
+
+        shared_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            result = _run_streamed(cmd, self.script_dir, shared_dir, timeout=1800)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            print(f"Warning: shared input preparation failed ({e}); running full workflow per combination")
+            return None
+
+        if result.returncode != 0:
+            print("Warning: shared input preparation failed; running full workflow per combination")
+            return None
+
+        return shared_dir
+
+    def get_worker_count(self) -> int:
+        """
+        Number of combinations to run concurrently
+
+        One unless --jobs asks for more: combinations that share the Ollama
+        server slow each other down, so their timings are only comparable
+        when they run one at a time.
+        """
+        return max(1, self.jobs or 1)
 
     def run_combination(self, model: str, prompt: str) -> Dict[str, Any]:
         """
@@ -256,39 +1132,72 @@ class ComprehensiveTester:
         combo_output = self.output_base / f"{safe_model}_{safe_prompt}"
         combo_output.mkdir(parents=True, exist_ok=True)
 
-        # Record start time
+        # An earlier run already completed this combination
+        done_file = combo_output / _DONE_FILE
+        if not self.force:
+            try:
+                result_data = _parse_checkpoint_line(done_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError, KeyError):
+                pass
+            else:
+                print(f"Skipping {model} + {prompt}: already completed")
+                self.update_statistics(result_data)
+                # The run that wrote .done also checkpointed it; tells
+                # run_comprehensive_test not to append it to results.jsonl again
+                result_data['_from_done'] = True
+                return result_data
+        # A failed re-run must not leave the old marker behind
+        done_file.unlink(missing_ok=True)
+
+        # Give a struggling server some room before trying again
+        if self._backoff > 0:
+            time.sleep(self._backoff)
+
+        # Make sure the model is loaded before timing this combination
+        self.warm_model(model)
+
+        # Record start time: wall clock for the report, the monotonic
+        # perf_counter for the duration so clock adjustments don't skew it
         start_time = datetime.now()
-
-        # Run complete workflow: video extraction, image conversion, description, HTML
-        # Ensure all paths are absolute to prevent issues when changing directories
-        abs_image_path = self.image_path.resolve()
-        abs_combo_output = combo_output.resolve()
+        start_counter = time.perf_counter()
+
+        # Frames and converted images don't depend on the model or prompt, so
+        # reuse the shared copies when available and only describe + report here
+        if self.shared_inputs is not None:
+            for step_dir in _SHARED_STEP_DIRS:
+                _link_shared_dir(self.shared_inputs / step_dir, combo_output / step_dir)
+            steps = "describe,html"
+        else:
+            steps = "video,convert,describe,html"
 
         # Use absolute path to workflow.py to avoid directory changing issues
         workflow_script = self.script_dir / "workflow.py"
 
         cmd = [
             sys.executable, str(workflow_script),
-            str(abs_image_path),
-            "--output-dir", str(abs_combo_output),
+            str(self.abs_image_path),
+            "--output-dir", str(combo_output),
             "--model", model,
             "--prompt-style", prompt,
-            "--steps", "video,convert,describe,html"
+            "--steps", steps
         ]
+        if self.env_cache:
+            cmd.extend(["--env-cache", str(self.env_cache)])
 
         print(f"Running: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
+            # Output goes to stdout.log/stderr.log in the combination
+            # directory; only the tail of each is kept for the reports
+            result = _run_streamed(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minute timeout
-                cwd=str(self.script_dir)  # Set working directory instead of changing it
+                self.script_dir,  # Set working directory instead of changing it
+                combo_output,
+                timeout=1800  # 30 minute timeout
             )
 
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=duration)
 
             # Analyze the results
             success = result.returncode == 0
@@ -309,19 +1218,20 @@ class ComprehensiveTester:
                 'success': success,
                 'error_message': error_message,
                 'output_dir': str(combo_output),
-                'stdout': result.stdout,
-                'stderr': result.stderr,
                 'created_files': created_files
             }
 
+            if success:
+                done_file.write_text(_checkpoint_line(result_data), encoding='utf-8')
+
             # Update statistics
             self.update_statistics(result_data)
 
             return result_data
 
         except subprocess.TimeoutExpired:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=duration)
             return {
                 'model': model,
                 'prompt': prompt,
@@ -331,13 +1241,11 @@ class ComprehensiveTester:
                 'success': False,
                 'error_message': 'Timeout after 30 minutes',
                 'output_dir': str(combo_output),
-                'stdout': '',
-                'stderr': 'Process timed out',
                 'created_files': {}
             }
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=duration)
             return {
                 'model': model,
                 'prompt': prompt,
@@ -347,8 +1255,6 @@ class ComprehensiveTester:
                 'success': False,
                 'error_message': str(e),
                 'output_dir': str(combo_output),
-                'stdout': '',
-                'stderr': str(e),
                 'created_files': {}
             }
 
@@ -366,101 +1272,82 @@ class ComprehensiveTester:
             'converted_count': 0
         }
 
-        if not output_dir.exists():
+        # One listing of the combination directory tells which step outputs
+        # exist; only those are scanned further
+        try:
+            with os.scandir(output_dir) as entries:
+                subdirs = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
             return created_files
 
         # Check for descriptions
-        desc_dir = output_dir / "descriptions"
-        if desc_dir.exists():
+        if "descriptions" in subdirs:
             created_files['descriptions'] = True
-            desc_file = desc_dir / "image_descriptions.txt"
-            if desc_file.exists():
-                created_files['description_file_size'] = desc_file.stat().st_size
+            try:
+                created_files['description_file_size'] = os.stat(
+                    os.path.join(output_dir, "descriptions", "image_descriptions.txt")
+                ).st_size
+            except OSError:
+                pass
 
         # Check for HTML reports
-        html_dir = output_dir / "html_reports"
-        if html_dir.exists():
+        if "html_reports" in subdirs:
             created_files['html_reports'] = True
-            html_files = list(html_dir.glob("*.html"))
-            created_files['html_file_count'] = len(html_files)
+            created_files['html_file_count'] = _count_files(output_dir / "html_reports", ('.html',)) or 0
 
         # Check for extracted frames
-        frames_dir = output_dir / "extracted_frames"
-        if frames_dir.exists():
+        if "extracted_frames" in subdirs:
             created_files['extracted_frames'] = True
-            frame_files = list(frames_dir.glob("*.jpg")) + list(frames_dir.glob("*.png"))
-            created_files['frame_count'] = len(frame_files)
+            created_files['frame_count'] = _count_files(output_dir / "extracted_frames", ('.jpg', '.png')) or 0
 
         # Check for converted images
-        converted_dir = output_dir / "converted_images"
-        if converted_dir.exists():
+        if "converted_images" in subdirs:
             created_files['converted_images'] = True
-            converted_files = list(converted_dir.glob("*.jpg")) + list(converted_dir.glob("*.png"))
-            created_files['converted_count'] = len(converted_files)
+            created_files['converted_count'] = _count_files(output_dir / "converted_images", ('.jpg', '.png')) or 0
 
         # Check for logs
-        logs_dir = output_dir / "logs"
-        if logs_dir.exists():
-            created_files['logs'] = True
+        created_files['logs'] = "logs" in subdirs
 
         return created_files
 
     def update_statistics(self, result: Dict[str, Any]) -> None:
-        """Update running statistics"""
-        model = result['model']
-        prompt = result['prompt']
-        duration = result['duration']
-        success = result['success']
-
-        # Update model statistics
-        if model not in self.model_stats:
-            self.model_stats[model] = {
-                'total_time': 0,
-                'total_runs': 0,
-                'successes': 0,
-                'failures': 0,
-                'avg_time': 0,
-                'prompts': {}
-            }
-
-        self.model_stats[model]['total_time'] += duration
-        self.model_stats[model]['total_runs'] += 1
-        if success:
-            self.model_stats[model]['successes'] += 1
-        else:
-            self.model_stats[model]['failures'] += 1
-        self.model_stats[model]['avg_time'] = self.model_stats[model]['total_time'] / self.model_stats[model]['total_runs']
-
-        # Update model-prompt statistics
-        if prompt not in self.model_stats[model]['prompts']:
-            self.model_stats[model]['prompts'][prompt] = {
-                'time': duration,
-                'success': success
-            }
-
-        # Update prompt statistics
-        if prompt not in self.prompt_stats:
-            self.prompt_stats[prompt] = {
-                'total_time': 0,
-                'total_runs': 0,
-                'successes': 0,
-                'failures': 0,
-                'avg_time': 0
-            }
+        """Update running statistics (safe to call from worker threads)"""
+        with self._stats_lock:
+            self._update_statistics(result)
+
+    def _update_statistics(self, result: Dict[str, Any]) -> None:
+        """Record a result for the statistics report; caller must hold _stats_lock"""
+        self._durations.append(result['duration'])
+        self._successes.append(result['success'])
+        self._model_ids.append(self._model_idx.setdefault(result['model'], len(self._model_idx)))
+        self._prompt_ids.append(self._prompt_idx.setdefault(result['prompt'], len(self._prompt_idx)))
+
+    def load_checkpoint(self) -> List[Dict[str, Any]]:
+        """
+        Read the results an earlier run saved to results.jsonl
 
-        self.prompt_stats[prompt]['total_time'] += duration
-        self.prompt_stats[prompt]['total_runs'] += 1
-        if success:
-            self.prompt_stats[prompt]['successes'] += 1
-        else:
-            self.prompt_stats[prompt]['failures'] += 1
-        self.prompt_stats[prompt]['avg_time'] = self.prompt_stats[prompt]['total_time'] / self.prompt_stats[prompt]['total_runs']
+        Returns:
+            Results of the combinations that run completed, oldest first;
+            empty if there is no checkpoint
+        """
+        results = []
+        try:
+            with open(self.output_base / _CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        results.append(_parse_checkpoint_line(line))
+                    except ValueError:
+                        continue  # Line cut short when the run was killed
+        except FileNotFoundError:
+            pass
+        return results
 
     def run_comprehensive_test(self) -> None:
         """Run the complete comprehensive test"""
         # Discover models and prompts
         models = self.discover_models()
         prompts = self.discover_prompt_styles()
+        self.write_env_cache(models, prompts)
 
         total_combinations = len(models) * len(prompts)
         print(f"\n=== STEP 3: Running {total_combinations} test combinations ===")
@@ -469,32 +1356,151 @@ class ComprehensiveTester:
         # Record overall start time
         self.start_time = datetime.now()
 
-        combination = 0
-        for model in models:
-            for prompt in prompts:
-                combination += 1
-
-                print(f"\n{'-'*70}")
-                print(f"Combination {combination}/{total_combinations}: {model} + {prompt}")
-                print(f"{'-'*70}")
-
-                result = self.run_combination(model, prompt)
-                self.results.append(result)
-
-                if result['success']:
-                    print(f"✅ SUCCESS: {model} with {prompt} ({result['duration']:.1f}s)")
-                else:
-                    print(f"❌ FAILED: {model} with {prompt} - {result['error_message']}")
+        # Extract frames and convert images once; combinations only describe
+        self.shared_inputs = self.prepare_shared_inputs()
+
+        # Each combination is a separate workflow.py subprocess whose runtime is
+        # dominated by Ollama inference, so run as many at once as the server
+        # has parallel slots. Threads are enough: they only wait on subprocesses.
+        combinations = [(model, prompt) for model in models for prompt in prompts]
+        workers = self.get_worker_count()
+        print(f"Running up to {workers} combinations concurrently")
+
+        # Pick up where an earlier, interrupted run into this directory stopped.
+        # Only successes count as done: failed, timed-out and crashed
+        # combinations are queued again (their rows stay in results.jsonl,
+        # followed by the retry's)
+        finished = {}
+        if not self.force:
+            for r in self.load_checkpoint():
+                if r['success'] and r['model'] in models and r['prompt'] in prompts:
+                    finished.setdefault((r['model'], r['prompt']), r)
+        done = list(finished.values())
+        pending = [combo for combo in combinations if combo not in finished]
+        if done:
+            print(f"Resuming: {len(done)} combinations already completed, {len(pending)} to run")
+        for result in done:
+            self.results.append(result)
+            self.update_statistics(result)
+
+        # Evict each model once its last pending prompt style finishes
+        remaining = defaultdict(int)
+        for model, _ in pending:
+            remaining[model] += 1
+
+        # Load each model while the previous one finishes its last prompt
+        # style, so the next combinations don't start with a model-load stall
+        model_order = list(remaining)
+        next_model = dict(zip(model_order, model_order[1:]))
+        evictions = []
+
+        # Write each CSV row and checkpoint line as soon as its combination
+        # finishes, so an interrupted run still leaves a valid CSV of what
+        # completed and can be resumed
+        csv_file = self.output_base / "comprehensive_test_data.csv"
+        checkpoint_file = self.output_base / _CHECKPOINT_FILE
+
+        completed = len(done)
+        with open(csv_file, 'w', newline='', encoding='utf-8') as csv_fh, \
+                open(checkpoint_file, 'w' if self.force else 'a', encoding='utf-8') as checkpoint, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            csv_fh.write(_csv_line(_CSV_HEADER))
+            csv_fh.writelines(_csv_line(_csv_row(result)) for result in done)
+            csv_fh.flush()
+
+            futures = {
+                executor.submit(self.run_combination, model, prompt): (model, prompt)
+                for model, prompt in pending
+            }
 
-                # Small delay to prevent system overload
-                time.sleep(1)
+            try:
+                for future in as_completed(futures):
+                    model, prompt = futures[future]
+                    result = future.result()
+                    # Where the HTML report looks for this combination's samples
+                    result['desc_file'] = os.path.join(result['output_dir'], "descriptions", "image_descriptions.txt")
+                    self.results.append(result)
+                    csv_fh.write(_csv_line(_csv_row(result)))
+                    csv_fh.flush()
+                    if not result.pop('_from_done', False):
+                        checkpoint.write(_checkpoint_line(result))
+                        checkpoint.flush()
+                    completed += 1
+
+                    print(f"\n{'-'*70}")
+                    print(f"Combination {completed}/{total_combinations}: {model} + {prompt}")
+                    print(f"{'-'*70}")
+
+                    if result['success']:
+                        print(f"✅ SUCCESS: {model} with {prompt} ({result['duration']:.1f}s)")
+                        self._backoff = 0.0
+                    else:
+                        print(f"❌ FAILED: {model} with {prompt} - {result['error_message']}")
+                        self._backoff = min(max(self._backoff * 2, _BACKOFF_START), _BACKOFF_MAX)
+
+                    remaining[model] -= 1
+                    if remaining[model] <= 1 and model in next_model:
+                        self.prefetch_model(next_model.pop(model))
+                    if remaining[model] == 0:
+                        # The unload is a blocking HTTP call; keep it out of
+                        # the loop that records finished combinations
+                        evictions.append(threading.Thread(target=self.evict_model, args=(model,), daemon=True))
+                        evictions[-1].start()
+            except BaseException:
+                # Interrupted: don't start the combinations still queued, and
+                # stop the running ones so leaving the pool doesn't wait on them
+                executor.shutdown(wait=False, cancel_futures=True)
+                _stop_processes()
+                raise
+
+        self._csv_streamed = True
+        for eviction in evictions:
+            eviction.join()
+
+        # Report in model/prompt order regardless of completion order
+        order = {combo: i for i, combo in enumerate(combinations)}
+        self.results.sort(key=lambda r: order[(r['model'], r['prompt'])])
 
         # Record overall end time
         self.end_time = datetime.now()
+        self._summary = self._summarize()
 
         # Generate comprehensive reports
         self.generate_reports()
 
+    def _summarize(self) -> Dict[str, Any]:
+        """
+        Derive everything the reports need from self.results in one pass
+
+        Returns:
+            Dictionary with total/successful/failed counts, the success
+            rate, the failed results, failures grouped by error message,
+            and successful results grouped by prompt style
+        """
+        failures = []
+        error_groups = defaultdict(list)
+        results_by_prompt = defaultdict(list)
+
+        for result in self.results:
+            if result['success']:
+                results_by_prompt[result['prompt']].append(result)
+            else:
+                failures.append(result)
+                error_groups[result['error_message'] or 'Unknown error'].append(result)
+
+        total = len(self.results)
+        successful = total - len(failures)
+
+        return {
+            'total': total,
+            'successful': successful,
+            'failed': len(failures),
+            'success_rate': (100.0 * successful / total) if total else 0.0,
+            'failures': failures,
+            'error_groups': error_groups,
+            'results_by_prompt': results_by_prompt
+        }
+
     def generate_reports(self) -> None:
         """Generate comprehensive test reports"""
         print(f"\n{'='*80}")
@@ -503,67 +1509,75 @@ class ComprehensiveTester:
 
         # Calculate summary statistics
         total_time = (self.end_time - self.start_time).total_seconds()
-        successful = sum(1 for r in self.results if r['success'])
-        failed = len(self.results) - successful
+        successful = self._summary['successful']
+        failed = self._summary['failed']
 
         print(f"Total Runtime: {timedelta(seconds=int(total_time))}")
-        print(f"Total Combinations: {len(self.results)}")
+        print(f"Total Combinations: {self._summary['total']}")
         print(f"Successful: {successful}")
         print(f"Failed: {failed}")
-        print(f"Success Rate: {(successful/len(self.results)*100):.1f}%")
+        print(f"Success Rate: {self._summary['success_rate']:.1f}%")
         print(f"Output Directory: {self.output_base}")
 
-        # Generate detailed text report
-        self.generate_text_report()
-
-        # Generate CSV report
-        self.generate_csv_report()
-
-        # Generate statistics report
-        self.generate_statistics_report()
-
-        # Generate comprehensive HTML report
-        self.generate_html_report()
-
-        # Show failures if any
+        # Text, CSV, statistics and HTML reports, plus the failure analysis
+        # if anything failed. Each writes its own file from the finished
+        # results, so they run side by side; the report phase takes as long
+        # as the slowest one rather than all of them combined.
+        generators = [
+            self.generate_text_report,
+            self.generate_csv_report,
+            self.generate_statistics_report,
+            self.generate_html_report,
+        ]
         if failed > 0:
-            self.generate_failure_report()
+            generators.append(self.generate_failure_report)
+
+        # Each generator returns its console message instead of printing
+        # from its thread; print them in a fixed order once all are done
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = [executor.submit(generate) for generate in generators]
+        for future in futures:
+            message = future.result()  # Re-raises any report's error here
+            if message:
+                print(message)
 
         print(f"\nDetailed reports saved in: {self.output_base}")
 
-    def generate_text_report(self) -> None:
-        """Generate detailed text report"""
+    def generate_text_report(self) -> str:
+        """Generate detailed text report; returns the console message"""
         report_file = self.output_base / "comprehensive_test_report.txt"
 
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("ImageDescriber Comprehensive Test Report\n")
-            f.write("="*50 + "\n\n")
+        with open(report_file, 'w', encoding='utf-8', buffering=_REPORT_BUFFER) as f:
+            # Collect the report in memory and write it in one call
+            parts = []
+            parts.append("ImageDescriber Comprehensive Test Report\n")
+            parts.append("="*50 + "\n\n")
 
-            f.write(f"Test Date: {self.start_time}\n")
-            f.write(f"Image Path: {self.image_path}\n")
-            f.write(f"Total Runtime: {self.end_time - self.start_time}\n")
-            f.write(f"Total Combinations: {len(self.results)}\n")
+            parts.append(f"Test Date: {self.start_time}\n")
+            parts.append(f"Image Path: {self.image_path}\n")
+            parts.append(f"Total Runtime: {self.end_time - self.start_time}\n")
+            parts.append(f"Total Combinations: {self._summary['total']}\n")
 
-            successful = sum(1 for r in self.results if r['success'])
-            failed = len(self.results) - successful
-            f.write(f"Successful: {successful}\n")
-            f.write(f"Failed: {failed}\n")
-            f.write(f"Success Rate: {(successful/len(self.results)*100):.1f}%\n\n")
+            successful = self._summary['successful']
+            failed = self._summary['failed']
+            parts.append(f"Successful: {successful}\n")
+            parts.append(f"Failed: {failed}\n")
+            parts.append(f"Success Rate: {self._summary['success_rate']:.1f}%\n\n")
 
             # Detailed results
-            f.write("Detailed Results:\n")
-            f.write("-" * 50 + "\n")
+            parts.append("Detailed Results:\n")
+            parts.append("-" * 50 + "\n")
 
             for result in self.results:
                 status = "✅ SUCCESS" if result['success'] else "❌ FAILED"
-                f.write(f"{status}: {result['model']} + {result['prompt']} ({result['duration']:.1f}s)\n")
+                parts.append(f"{status}: {result['model']} + {result['prompt']} ({result['duration']:.1f}s)\n")
                 if not result['success']:
-                    f.write(f"  Error: {result['error_message']}\n")
-                f.write(f"  Output: {result['output_dir']}\n")
+                    parts.append(f"  Error: {result['error_message']}\n")
+                parts.append(f"  Output: {result['output_dir']}\n")
 
                 # File creation summary
                 files = result['created_files']
-                f.write("  Created: ")
+                parts.append("  Created: ")
                 created_items = []
                 if files['descriptions']:
                     created_items.append(f"descriptions ({files['description_file_size']} bytes)")
@@ -576,54 +1590,51 @@ class ComprehensiveTester:
                 if files['logs']:
                     created_items.append("logs")
 
-                f.write(", ".join(created_items) if created_items else "none")
-                f.write("\n\n")
+                parts.append(", ".join(created_items) if created_items else "none")
+                parts.append("\n\n")
+
+            f.write("".join(parts))
 
-        print(f"Text report saved: {report_file}")
+        return f"Text report saved: {report_file}"
 
-    def generate_csv_report(self) -> None:
-        """Generate CSV report for data analysis"""
+    def generate_csv_report(self) -> str:
+        """Generate CSV report for data analysis; returns the console message"""
         csv_file = self.output_base / "comprehensive_test_data.csv"
 
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        # run_comprehensive_test() already wrote the rows as results came in
+        if not self._csv_streamed:
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=_REPORT_BUFFER) as f:
+                f.write(_csv_line(_CSV_HEADER))
+                f.writelines(_csv_line(_csv_row(result)) for result in self.results)
 
-            # Header
-            writer.writerow([
-                'Model', 'Prompt', 'Success', 'Duration_Seconds', 'Error_Message',
-                'Output_Directory', 'Descriptions_Created', 'HTML_Created',
-                'Frames_Extracted', 'Images_Converted', 'Logs_Created',
-                'Description_File_Size', 'HTML_File_Count', 'Frame_Count', 'Converted_Count'
-            ])
+        return f"CSV data saved: {csv_file}"
 
-            # Data rows
-            for result in self.results:
-                files = result['created_files']
-                writer.writerow([
-                    result['model'],
-                    result['prompt'],
-                    result['success'],
-                    result['duration'],
-                    result['error_message'] or '',
-                    result['output_dir'],
-                    files['descriptions'],
-                    files['html_reports'],
-                    files['extracted_frames'],
-                    files['converted_images'],
-                    files['logs'],
-                    files['description_file_size'],
-                    files['html_file_count'],
-                    files['frame_count'],
-                    files['converted_count']
-                ])
-
-        print(f"CSV data saved: {csv_file}")
-
-    def generate_statistics_report(self) -> None:
-        """Generate detailed statistics report"""
+    def generate_statistics_report(self) -> str:
+        """Generate detailed statistics report; returns the console message"""
         stats_file = self.output_base / "test_statistics.txt"
 
-        with open(stats_file, 'w', encoding='utf-8') as f:
+        durations = np.asarray(self._durations, dtype=np.float64)
+        successes = np.asarray(self._successes, dtype=np.float64)
+        model_ids = np.asarray(self._model_ids, dtype=np.intp)
+        prompt_ids = np.asarray(self._prompt_ids, dtype=np.intp)
+
+        def aggregate(ids, count):
+            """Total time, runs and successes per id"""
+            return (np.bincount(ids, weights=durations, minlength=count),
+                    np.bincount(ids, minlength=count),
+                    np.bincount(ids, weights=successes, minlength=count))
+
+        model_time, model_runs, model_successes = aggregate(model_ids, len(self._model_idx))
+        prompt_time, prompt_runs, prompt_successes = aggregate(prompt_ids, len(self._prompt_idx))
+
+        # First result of each prompt style per model, in arrival order
+        prompt_names = list(self._prompt_idx)
+        breakdown = defaultdict(dict)
+        for mid, pid, duration, success in zip(self._model_ids, self._prompt_ids,
+                                               self._durations, self._successes):
+            breakdown[mid].setdefault(prompt_names[pid], (duration, success))
+
+        with open(stats_file, 'w', encoding='utf-8', buffering=_REPORT_BUFFER) as f:
             f.write("ImageDescriber Test Statistics\n")
             f.write("="*40 + "\n\n")
 
@@ -631,63 +1642,75 @@ class ComprehensiveTester:
             f.write("Model Performance Statistics:\n")
             f.write("-" * 40 + "\n")
 
-            for model, stats in sorted(self.model_stats.items()):
+            for model, mid in sorted(self._model_idx.items()):
+                runs = int(model_runs[mid])
+                succeeded = int(model_successes[mid])
                 f.write(f"\n{model}:\n")
-                f.write(f"  Total Time: {timedelta(seconds=int(stats['total_time']))}\n")
-                f.write(f"  Average Time: {stats['avg_time']:.1f}s\n")
-                f.write(f"  Successes: {stats['successes']}/{stats['total_runs']}\n")
-                f.write(f"  Success Rate: {(stats['successes']/stats['total_runs']*100):.1f}%\n")
+                f.write(f"  Total Time: {timedelta(seconds=int(model_time[mid]))}\n")
+                f.write(f"  Average Time: {model_time[mid] / runs:.1f}s\n")
+                f.write(f"  Successes: {succeeded}/{runs}\n")
+                f.write(f"  Success Rate: {(succeeded / runs * 100):.1f}%\n")
 
                 f.write("  Per-prompt breakdown:\n")
-                for prompt, prompt_data in stats['prompts'].items():
-                    status = "✅" if prompt_data['success'] else "❌"
-                    f.write(f"    {status} {prompt}: {prompt_data['time']:.1f}s\n")
+                for prompt, (duration, success) in breakdown[mid].items():
+                    status = "✅" if success else "❌"
+                    f.write(f"    {status} {prompt}: {duration:.1f}s\n")
 
             # Prompt statistics
             f.write("\n\nPrompt Style Statistics:\n")
             f.write("-" * 40 + "\n")
 
-            for prompt, stats in sorted(self.prompt_stats.items()):
+            for prompt, pid in sorted(self._prompt_idx.items()):
+                runs = int(prompt_runs[pid])
+                succeeded = int(prompt_successes[pid])
                 f.write(f"\n{prompt}:\n")
-                f.write(f"  Total Time: {timedelta(seconds=int(stats['total_time']))}\n")
-                f.write(f"  Average Time: {stats['avg_time']:.1f}s\n")
-                f.write(f"  Successes: {stats['successes']}/{stats['total_runs']}\n")
-                f.write(f"  Success Rate: {(stats['successes']/stats['total_runs']*100):.1f}%\n")
+                f.write(f"  Total Time: {timedelta(seconds=int(prompt_time[pid]))}\n")
+                f.write(f"  Average Time: {prompt_time[pid] / runs:.1f}s\n")
+                f.write(f"  Successes: {succeeded}/{runs}\n")
+                f.write(f"  Success Rate: {(succeeded / runs * 100):.1f}%\n")
 
-        print(f"Statistics report saved: {stats_file}")
+        return f"Statistics report saved: {stats_file}"
 
-    def generate_failure_report(self) -> None:
-        """Generate detailed failure analysis"""
-        failures = [r for r in self.results if not r['success']]
+    def generate_failure_report(self) -> Optional[str]:
+        """
+        Generate detailed failure analysis
+
+        Returns:
+            Console message with a failure summary, or None if nothing failed
+        """
+        failures = self._summary['failures']
+        error_groups = self._summary['error_groups']
 
         if not failures:
-            return
+            return None
 
         failure_file = self.output_base / "failure_analysis.txt"
 
-        with open(failure_file, 'w', encoding='utf-8') as f:
+        with open(failure_file, 'w', encoding='utf-8', buffering=_REPORT_BUFFER) as f:
             f.write("Failure Analysis Report\n")
             f.write("="*30 + "\n\n")
 
             f.write(f"Total Failures: {len(failures)}\n\n")
 
-            # Group failures by error type
-            error_groups = {}
-            for failure in failures:
-                error = failure['error_message'] or 'Unknown error'
-                if error not in error_groups:
-                    error_groups[error] = []
-                error_groups[error].append(failure)
-
+            # Failures grouped by error type
             f.write("Failures by Error Type:\n")
             f.write("-" * 30 + "\n")
 
+            # Results don't carry the workflow output; read it back from
+            # the failed combinations' logs, once each
+            logs = {}
+            for failure in failures:
+                output_dir = Path(failure['output_dir'])
+                logs[failure['output_dir']] = (_read_log_tail(output_dir / "stdout.log"),
+                                               _read_log_tail(output_dir / "stderr.log"))
+
             for error, failure_list in error_groups.items():
                 f.write(f"\n{error} ({len(failure_list)} occurrences):\n")
                 for failure in failure_list:
                     f.write(f"  - {failure['model']} + {failure['prompt']}\n")
-                    if failure['stderr']:
-                        f.write(f"    stderr: {failure['stderr'][:200]}...\n")
+                    stderr = logs[failure['output_dir']][1]
+                    if stderr:
+                        f.write(f"    stderr: {stderr[:200]}...\n")
 
             f.write("\n\nDetailed Failure Information:\n")
             f.write("-" * 30 + "\n")
@@ -697,414 +1720,131 @@ class ComprehensiveTester:
                 f.write(f"  Duration: {failure['duration']:.1f}s\n")
                 f.write(f"  Error: {failure['error_message']}\n")
                 f.write(f"  Output Dir: {failure['output_dir']}\n")
-                if failure['stdout']:
-                    f.write(f"  stdout: {failure['stdout'][:500]}...\n")
-                if failure['stderr']:
-                    f.write(f"  stderr: {failure['stderr'][:500]}...\n")
-
-        print(f"Failure analysis saved: {failure_file}")
-
-        # Also print summary to console
-        print("\nFAILURE SUMMARY:")
-        error_groups = {}
-        for failure in failures:
-            error = failure['error_message'] or 'Unknown error'
-            error_groups[error] = error_groups.get(error, 0) + 1
-
-        for error, count in error_groups.items():
-            print(f"  {error}: {count} occurrences")
+                stdout, stderr = logs[failure['output_dir']]
+                if stdout:
+                    f.write(f"  stdout: {stdout[:500]}...\n")
+                if stderr:
+                    f.write(f"  stderr: {stderr[:500]}...\n")
+
+        # Summary for the console as well
+        lines = [f"Failure analysis saved: {failure_file}", "\nFAILURE SUMMARY:"]
+        lines.extend(f"  {error}: {len(failure_list)} occurrences"
+                     for error, failure_list in error_groups.items())
+        return "\n".join(lines)
+
+    def generate_html_report(self) -> str:
+        """
+        Generate comprehensive HTML report with visual comparison of all results
 
-    def generate_html_report(self) -> None:
-        """Generate comprehensive HTML report with visual comparison of all results"""
+        Returns:
+            Console message naming the report file
+        """
         html_file = self.output_base / "comprehensive_test_visual_report.html"
 
-        # Group results by prompt style, then by model
-        results_by_prompt = {}
-        successful_results = [r for r in self.results if r['success']]
-
-        for result in successful_results:
-            prompt = result['prompt']
-            if prompt not in results_by_prompt:
-                results_by_prompt[prompt] = []
-            results_by_prompt[prompt].append(result)
+        # Encode once and hand the bytes to a single binary write
+        data = self._build_html_report(self.image_files).encode('utf-8')
+        if self.gzip_html:
+            # The repetitive card markup compresses well even at the fastest level
+            html_file = html_file.with_name(html_file.name + ".gz")
+            data = gzip.compress(data, compresslevel=1)
+        html_file.write_bytes(data)
 
-        # Get list of image files from the test directory
-        image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.bmp', '*.webp']:
-            image_files.extend(self.image_path.glob(ext))
-            image_files.extend(self.image_path.glob(ext.upper()))
-
-        total_successful = len(successful_results)
-        total_failed = len(self.results) - total_successful
-
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ImageDescriber Comprehensive Test Results</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1, h2, h3, h4, h5 {{
-            color: #333;
-        }}
-        h4 {{
-            color: #212529;
-            font-size: 1.1em;
-            margin: 20px 0 10px 0;
-            border-bottom: 1px solid #e9ecef;
-            padding-bottom: 5px;
-        }}
-        h5 {{
-            color: #212529;
-            font-size: 1em;
-            margin: 15px 0 8px 0;
-            font-weight: 600;
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #e0e0e0;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-        }}
-        .stat-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border-left: 4px solid #0056b3;
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #0056b3;
-        }}
-        .stat-label {{
-            color: #212529;
-            font-size: 0.9em;
-        }}
-        .prompt-section {{
-            margin-bottom: 50px;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        .prompt-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            font-size: 1.3em;
-            font-weight: bold;
-        }}
-        .model-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }}
-        .model-card {{
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            overflow: hidden;
-            background: white;
-        }}
-        .model-header {{
-            background: #f8f9fa;
-            padding: 15px;
-            font-weight: bold;
-            color: #333;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        .description-header {{
-            color: #212529;
-            font-size: 1em;
-            font-weight: 600;
-            margin: 15px 0 5px 0;
-            padding: 0;
-        }}
-        .model-content {{
-            padding: 15px;
-        }}
-        .timing-info {{
-            font-size: 0.9em;
-            color: #495057;
-            margin-bottom: 10px;
-        }}
-        .description {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 3px solid #28a745;
-            font-style: italic;
-            margin-bottom: 15px;
-        }}
-        .image-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-            margin-top: 15px;
-        }}
-        .image-item {{
-            text-align: center;
-        }}
-        .image-item img {{
-            max-width: 100%;
-            height: 120px;
-            object-fit: cover;
-            border-radius: 5px;
-            border: 1px solid #ddd;
-        }}
-        .image-name {{
-            font-size: 0.8em;
-            color: #495057;
-            margin-top: 5px;
-        }}
-        .toc {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-        }}
-        .toc h3 {{
-            margin-top: 0;
-        }}
-        .toc ul {{
-            list-style: none;
-            padding: 0;
-        }}
-        .toc li {{
-            margin: 8px 0;
-        }}
-        .toc a {{
-            color: #0056b3;
-            text-decoration: none;
-            padding: 5px 10px;
-            border-radius: 4px;
-            transition: background-color 0.2s;
-        }}
-        .toc a:hover {{
-            background-color: #e3f2fd;
-        }}
-        .no-results {{
-            text-align: center;
-            color: #495057;
-            font-style: italic;
-            padding: 40px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>ImageDescriber Comprehensive Test Results</h1>
-            <p><strong>Test Date:</strong> {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p><strong>Image Path:</strong> {self.image_path}</p>
-        </div>
+        return f"Comprehensive HTML report saved: {html_file}"
 
-        <div class="summary">
-            <div class="stat-card">
-                <div class="stat-number">{len(self.results)}</div>
-                <div class="stat-label">Total Combinations Tested</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{total_successful}</div>
-                <div class="stat-label">Successful Tests</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{total_failed}</div>
-                <div class="stat-label">Failed Tests</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{(total_successful/len(self.results)*100):.1f}%</div>
-                <div class="stat-label">Success Rate</div>
-            </div>
-        </div>
+    def _build_html_report(self, image_files: List[Path]) -> str:
+        """
+        Render the visual HTML report
 
-        <div class="toc">
-            <h2>Table of Contents</h2>
-            <ul>""")
+        Args:
+            image_files: Test images listed in the overview section
 
-            for prompt in sorted(results_by_prompt.keys()):
-                f.write(f'                <li><a href="#prompt-{self.sanitize_name(prompt)}">{prompt.title()} Style ({len(results_by_prompt[prompt])} models)</a></li>\n')
+        Returns:
+            The complete HTML document
+        """
+        # Successful results grouped by prompt style
+        results_by_prompt = self._summary['results_by_prompt']
+
+        total_successful = self._summary['successful']
+        total_failed = self._summary['failed']
+
+        # Collect the report in memory and join it once at the end
+        parts = [_HTML_PREAMBLE]
+        parts.append(_HTML_HEADER_TEMPLATE.format_map({
+            'start_time': self.start_time,
+            'image_path': self.image_path,
+            'total': self._summary['total'],
+            'successful': total_successful,
+            'failed': total_failed,
+            'success_rate': self._summary['success_rate'],
+        }))
+
+        # Anchor, heading and fastest-first results for each prompt style,
+        # shared by the table of contents and the sections
+        prompt_meta = [
+            (self.sanitize_name(prompt), prompt.title(),
+             sorted(results_by_prompt[prompt], key=_BY_DURATION))
+            for prompt in sorted(results_by_prompt)
+        ]
 
-            f.write("""            </ul>
+        # Read every combination's description file up front; the reads are
+        # independent and I/O-bound, so overlap them on a few threads
+        def read_samples(result):
+            try:
+                return _read_sample_descriptions(result['desc_file'])
+            except Exception as e:
+                print(f"Error parsing descriptions for {result['model']}: {e}")
+                return {}
+
+        report_results = [result for _, _, prompt_results in prompt_meta for result in prompt_results]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            samples = dict(zip(
+                (result['output_dir'] for result in report_results),
+                executor.map(read_samples, report_results)
+            ))
+
+        parts.extend(
+            _TOC_ITEM.format(anchor=anchor, title=title, count=len(prompt_results))
+            for anchor, title, prompt_results in prompt_meta
+        )
+
+        parts.append("""            </ul>
         </div>
 """)
 
-            # Generate sections for each prompt style
-            for prompt in sorted(results_by_prompt.keys()):
-                prompt_results = results_by_prompt[prompt]
-                f.write(f"""
-        <div class="prompt-section" id="prompt-{self.sanitize_name(prompt)}">
-            <h2 class="prompt-header">
-                {prompt.title()} Style - {len(prompt_results)} Models Tested
-            </h2>
-            <div class="model-grid">""")
-
-                # Sort models by average duration for this prompt
-                prompt_results.sort(key=lambda x: x['duration'])
-
-                for result in prompt_results:
-                    model = result['model']
-                    duration = result['duration']
-                    output_dir = Path(result['output_dir'])
-
-                    # Try to read the description file
-                    desc_file = output_dir / "descriptions" / "image_descriptions.txt"
-                    descriptions = {}
-
-                    if desc_file.exists():
-                        try:
-                            with open(desc_file, 'r', encoding='utf-8') as df:
-                                content = df.read()
-                                # Parse descriptions in the format:
-                                # File: filename.jpg
-                                # Model: model_name
-                                # Prompt Style: style
-                                # Description: actual description
-
-                                sections = content.split('\nFile: ')
-                                for section in sections[1:]:  # Skip header section
-                                    lines = section.split('\n')
-                                    if len(lines) >= 4:
-                                        filename = lines[0].strip()
-                                        # Find the description line
-                                        desc_start = None
-                                        for i, line in enumerate(lines):
-                                            if line.startswith('Description: '):
-                                                desc_start = i
-                                                break
-
-                                        if desc_start is not None:
-                                            # Get description (may span multiple lines)
-                                            desc_lines = []
-                                            desc_lines.append(lines[desc_start][13:])  # Remove "Description: " prefix
-
-                                            # Continue reading until next section or end
-                                            for i in range(desc_start + 1, len(lines)):
-                                                if (lines[i].startswith('File: ') or
-                                                    lines[i].startswith('================') or
-                                                    lines[i].startswith('----------------')):
-                                                    break
-                                                desc_lines.append(lines[i])
-
-                                            description = '\n'.join(desc_lines).strip()
-                                            if description:
-                                                descriptions[filename] = description
-                        except Exception as e:
-                            print(f"Error parsing descriptions for {model}: {e}")
-                            pass
-
-                    f.write(f"""
-                <div class="model-card">
-                    <h3 class="model-header">
-                        {model}
-                    </h3>
-                    <div class="model-content">
-                        <h4>Performance Details</h4>
-                        <div class="timing-info">
-                            Processing Time: {duration:.1f} seconds
-                        </div>""")
-
-                    # Show sample descriptions
-                    if descriptions:
-                        f.write("""
-                        <h4>Generated Descriptions</h4>""")
-                        # Show first few descriptions as examples
-                        sample_count = 0
-                        for filename, desc in list(descriptions.items())[:3]:  # Show first 3
-                            if desc and sample_count < 3:
-                                f.write(f"""
-                        <h5 class="description-header">{filename}</h5>
-                        <div class="description">
-                            {desc.replace('<', '&lt;').replace('>', '&gt;')}
-                        </div>""")
-                                sample_count += 1
-
-                        if len(descriptions) > 3:
-                            f.write(f"""
-                        <h4>Summary</h4>
-                        <div style="text-align: center; color: #495057; font-style: italic; margin-top: 10px;">
-                            Total: {len(descriptions)} images described
-                        </div>""")
-                        else:
-                            f.write(f"""
-                        <h4>Summary</h4>
-                        <div style="text-align: center; color: #495057; font-style: italic; margin-top: 10px;">
-                            Total: {len(descriptions)} images described
-                        </div>""")
-                    else:
-                        f.write("""
-                        <h4>Generated Descriptions</h4>
-                        <div class="description" style="border-left-color: #dc3545;">
-                            No descriptions found or failed to parse description file.
-                        </div>""")
-
-                    f.write("""
-                    </div>
-                </div>""")
-
-                f.write("""
-            </div>
-        </div>""")
-
-            # Add test images section
-            if image_files:
-                f.write(f"""
-        <div class="prompt-section">
-            <h2 class="prompt-header">
-                Test Images Used ({len(image_files)} images)
-            </h2>
-            <div style="padding: 20px;">
-                <h3>Image Files Overview</h3>
-                <div class="image-grid">""")
-
-                for img_file in image_files[:12]:  # Show first 12 images
-                    # Create relative path for web display
-                    rel_path = img_file.relative_to(self.image_path)
-                    f.write(f"""
-                    <div class="image-item">
-                        <div class="image-name">{img_file.name}</div>
-                    </div>""")
-
-                f.write("""
-                </div>
-            </div>
-        </div>""")
-
-            f.write(f"""
-
-        <div style="text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #e0e0e0; color: #495057;">
-            <p>Generated by ImageDescriber Comprehensive Testing Tool</p>
-            <p>Total Runtime: {self.end_time - self.start_time} | {len(image_files)} test images processed</p>
-        </div>
-
-    </div>
-</body>
-</html>""")
-
-        print(f"Comprehensive HTML report saved: {html_file}")
+        # Generate sections for each prompt style
+        for anchor, title, prompt_results in prompt_meta:
+            parts.append(_PROMPT_SECTION.format(
+                anchor=anchor,
+                title=title,
+                count=len(prompt_results),
+                cards="".join(
+                    _render_card(result, samples[result['output_dir']]) for result in prompt_results
+                )
+            ))
+
+        # Add test images section
+        if image_files:
+            # Show the first 12 images by name
+            parts.append(_IMAGES_SECTION.format(
+                count=len(image_files),
+                items="".join(_IMAGE_ITEM.format(name=_escape_text(img_file.name))
+                              for img_file in image_files[:12])
+            ))
+
+        parts.append(_HTML_FOOTER_TEMPLATE.format_map({
+            'runtime': self.end_time - self.start_time,
+            'image_count': len(image_files),
+        }))
+
+        return "".join(parts)
+
+
+def _interrupted(signum, frame):
+    """Stop on Ctrl-C instead of finishing queued work; main() does the cleanup"""
+    # Only async-signal-safe work here: print() could re-enter a write the
+    # main thread was in the middle of
+    os.write(1, b"\n\nTesting interrupted by user\n")
+    raise KeyboardInterrupt
 
 
 def main():
@@ -1135,19 +1875,46 @@ Example:
         help="Custom output directory for test results"
     )
 
+    parser.add_argument(
+        "--per-image-json",
+        action="store_true",
+        help="Also write one JSON file per image next to manifest.json"
+    )
+
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write the visual HTML report as comprehensive_test_visual_report.html.gz"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Number of combinations to run concurrently (default: 1; more makes timings less comparable)"
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run every combination instead of resuming from results in the output directory"
+    )
+
     args = parser.parse_args()
 
+    signal.signal(signal.SIGINT, _interrupted)
+
     try:
-        tester = ComprehensiveTester(args.image_path, args.output_dir)
+        tester = ComprehensiveTester(args.image_path, args.output_dir, gzip_html=args.gzip,
+                                     jobs=args.jobs, force=args.force)
         tester.run_comprehensive_test()
         # After running the comprehensive test, compile all descriptions to JSON
         # Output to the output directory used for the test
         json_output_dir = tester.output_base
         print(f"\nCompiling all image descriptions to JSON files in: {json_output_dir}")
-        tester.compile_descriptions_to_json(str(json_output_dir))
+        tester.compile_descriptions_to_json(str(json_output_dir), per_image=args.per_image_json)
 
     except KeyboardInterrupt:
-        print("\n\nTesting interrupted by user")
+        _stop_processes()
         sys.exit(130)
     except Exception as e:
         print(f"\nError: {e}")
@@ -146,10 +146,6 @@ class DescriptionEntry:
         str
             HTML string representing the image description entry.
         """
-
-        Args:
-            include_details: Whether to include the details section with metadata
-        """
         html_content = []
 
         # Photo name as H2
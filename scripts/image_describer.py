@@ -22,12 +22,15 @@ import sys
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TextIO
 import base64
 import json
 import gc
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 
 import ollama
 from PIL import Image
@@ -41,6 +44,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Marker the model is asked to put before each description in a batch reply
+_BATCH_MARKER = re.compile(r'^[ \t*_#>-]*IMAGE[ \t]+(\d+)[ \t*_]*:[ \t*_]*', re.IGNORECASE | re.MULTILINE)
+
 
 def setup_logging(log_dir: Optional[str] = None, verbose: bool = False) -> None:
     """
@@ -101,7 +107,7 @@ class ImageDescriber:
     def __init__(self, model_name: str = None, max_image_size: int = 1024,
                  enable_compression: bool = True, batch_delay: float = 2.0,
                  config_file: str = "image_describer_config.json", prompt_style: str = "detailed",
-                 output_dir: str = None):
+                 output_dir: str = None, concurrency: int = 1, batch_size: int = 1):
         """
         Initialize the ImageDescriber
 
@@ -113,6 +119,8 @@ class ImageDescriber:
             config_file: Path to the JSON configuration file
             prompt_style: Style of prompt to use (detailed, concise, artistic, technical)
             output_dir: Custom output directory (default: same as input directory)
+            concurrency: Number of images to send to Ollama at once
+            batch_size: Number of images to describe in a single multi-image request
         """
         # Load configuration first
         self.config = self.load_config(config_file)
@@ -128,11 +136,18 @@ class ImageDescriber:
         self.batch_delay = batch_delay
         self.prompt_style = prompt_style
         self.output_dir = output_dir  # Custom output directory
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
 
         # Set supported formats from config
         self.supported_formats = set(self.config.get('processing_options', {}).get('supported_formats',
                                                     ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp']))
 
+        # One HTTP client for the whole run so the connection to the Ollama
+        # server is reused; keep_alive keeps the model loaded between images
+        self.keep_alive = self.config.get('processing_options', {}).get('keep_alive', '30m')
+        self.client = ollama.Client()
+
     def load_config(self, config_file: str) -> dict:
         """
         Load configuration from JSON file
@@ -206,6 +221,7 @@ class ImageDescriber:
                 "default_batch_delay": 2.0,
                 "default_compression": True,
                 "extract_metadata": True,
+                "keep_alive": "30m",
                 "supported_formats": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"]
             }
         }
@@ -346,37 +362,14 @@ class ImageDescriber:
             logger.debug(f"Using model settings: {model_settings}")
 
             # Call Ollama API with configured settings
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {
-                        'role': 'user',
-                        'content': prompt,
-                        'images': [image_base64]
-                    }
-                ],
-                options=model_settings
-            )
-
-            logger.debug(f"Raw response: {response}")
-            logger.debug(f"Response type: {type(response)}")
-            logger.debug(f"Response keys: {response.keys() if hasattr(response, 'keys') else 'no keys'}")
-            if 'message' in response:
-                logger.debug(f"Message: {response['message']}")
-                logger.debug(f"Message type: {type(response['message'])}")
-                if hasattr(response['message'], 'content'):
-                    logger.debug(f"Message content: {repr(response['message'].content)}")
-                elif 'content' in response['message']:
-                    logger.debug(f"Message content dict: {repr(response['message']['content'])}")
-
-            description = response['message']['content'].strip()
+            description = self._call_ollama_api(prompt, image_base64, model_settings)
             logger.info(f"Generated description for {image_path.name}")
             logger.debug(f"Description content: {repr(description)}")
             logger.debug(f"Description length: {len(description)}")
             logger.debug(f"Description bool: {bool(description)}")
 
             # Clean up memory
-            del image_base64, response
+            del image_base64
             gc.collect()
 
             return description
@@ -387,7 +380,111 @@ class ImageDescriber:
             gc.collect()
             return None
 
-    def write_description_to_file(self, image_path: Path, description: str, output_file: Path, metadata: Dict[str, Any] = None, base_directory: Path = None) -> bool:
+    def _call_ollama_api(self, prompt: str, image_base64: str, model_settings: dict = None) -> str:
+        """
+        Send one image to the Ollama chat API over the persistent client
+
+        Args:
+            prompt: Prompt text to send with the image
+            image_base64: Base64-encoded image data
+            model_settings: Model options for the request
+
+        Returns:
+            Stripped description text from the model response
+        """
+        response = self.client.chat(
+            model=self.model_name,
+            messages=[
+                {
+                    'role': 'user',
+                    'content': prompt,
+                    'images': [image_base64]
+                }
+            ],
+            options=model_settings,
+            keep_alive=self.keep_alive
+        )
+
+        logger.debug(f"Raw response: {response}")
+        return response['message']['content'].strip()
+
+    def get_batch_descriptions(self, image_paths: List[Path]) -> List[Optional[str]]:
+        """
+        Describe several images with a single multi-image Ollama request
+
+        The model is asked to prefix each description with "IMAGE N:". If the
+        reply cannot be split into exactly one description per image, each
+        image is described with its own request instead.
+
+        Args:
+            image_paths: Paths of the images to describe, in order
+
+        Returns:
+            List of description strings (or None on failure), one per image
+        """
+        try:
+            images = [self.encode_image_to_base64(image_path) for image_path in image_paths]
+            if all(images):
+                count = len(images)
+                prompt = (
+                    f"{self.get_prompt()}\n\n"
+                    f"You are given {count} images. Describe each image separately, in order. "
+                    f"Start each description with 'IMAGE N:' on its own line, where N is 1 to {count}."
+                )
+                response = self.client.chat(
+                    model=self.model_name,
+                    messages=[
+                        {
+                            'role': 'user',
+                            'content': prompt,
+                            'images': images
+                        }
+                    ],
+                    options=self.get_model_settings(),
+                    keep_alive=self.keep_alive
+                )
+                logger.debug(f"Raw batch response: {response}")
+
+                descriptions = self._split_batch_response(response['message']['content'], count)
+                if descriptions:
+                    for image_path in image_paths:
+                        logger.info(f"Generated description for {image_path.name}")
+                    return descriptions
+
+                logger.warning(f"Could not split batch response into {count} descriptions; "
+                               "falling back to one request per image")
+            del images
+        except Exception as e:
+            logger.error(f"Error generating batch description: {e}; falling back to one request per image")
+
+        return [self.get_image_description(image_path) for image_path in image_paths]
+
+    @staticmethod
+    def _split_batch_response(text: str, count: int) -> Optional[List[str]]:
+        """
+        Split a multi-image reply on its "IMAGE N:" markers
+
+        Args:
+            text: Model reply text
+            count: Number of images that were sent
+
+        Returns:
+            List of descriptions in image order, or None if the markers are
+            missing, duplicated or out of range
+        """
+        parts = _BATCH_MARKER.split(text)
+        # parts = [preamble, n1, text1, n2, text2, ...]
+        numbers = [int(n) for n in parts[1::2]]
+        if numbers != list(range(1, count + 1)):
+            return None
+
+        descriptions = [part.strip() for part in parts[2::2]]
+        if not all(descriptions):
+            return None
+        return descriptions
+
+    def write_description_to_file(self, image_path: Path, description: str, output_file: Path, metadata: Dict[str, Any] = None, base_directory: Path = None,
+                                  output_handle: Optional[TextIO] = None) -> bool:
         """
         Write description to a text file
 
@@ -397,6 +494,8 @@ class ImageDescriber:
             output_file: Path to the output text file
             metadata: Optional metadata dictionary to include
             base_directory: Base directory for calculating relative paths
+            output_handle: Already-open text handle for output_file; if given,
+                the entry is written to it instead of reopening the file
 
         Returns:
             True if successful, False otherwise
@@ -410,36 +509,40 @@ class ImageDescriber:
             if base_directory:
                 try:
                     relative_path = image_path.relative_to(base_directory)
-                    entry = f"File: {relative_path}\n"
+                    parts = [f"File: {relative_path}\n"]
                 except ValueError:
                     # Fallback if relative path calculation fails
-                    entry = f"File: {image_path.name}\n"
+                    parts = [f"File: {image_path.name}\n"]
             else:
-                entry = f"File: {image_path.name}\n"
+                parts = [f"File: {image_path.name}\n"]
 
             if output_format.get('include_file_path', True):
-                entry += f"Path: {image_path}\n"
+                parts.append(f"Path: {image_path}\n")
 
             # Add metadata if enabled and available
             if output_format.get('include_metadata', True) and metadata:
                 metadata_str = self.format_metadata(metadata)
                 if metadata_str:
-                    entry += f"{metadata_str}\n"
+                    parts.append(f"{metadata_str}\n")
 
             if output_format.get('include_model_info', True):
-                entry += f"Model: {self.model_name}\n"
-                entry += f"Prompt Style: {self.prompt_style}\n"
+                parts.append(f"Model: {self.model_name}\n")
+                parts.append(f"Prompt Style: {self.prompt_style}\n")
 
-            entry += f"Description: {description}\n"
+            parts.append(f"Description: {description}\n")
 
             if output_format.get('include_timestamp', True):
-                entry += f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                parts.append(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-            entry += separator_char * 80 + "\n\n"
+            parts.append(separator_char * 80 + "\n\n")
 
-            # Append to the file
-            with open(output_file, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            # Append to the file, reusing the caller's handle when available
+            if output_handle is not None:
+                output_handle.write("".join(parts))
+                output_handle.flush()
+            else:
+                with open(output_file, 'a', encoding='utf-8') as f:
+                    f.write("".join(parts))
 
             logger.info(f"Successfully wrote description for {image_path.name} to {output_file.name}")
             return True
@@ -524,21 +627,30 @@ class ImageDescriber:
         success_count = 0
         overall_start_time = time.time()
 
-        for i, image_path in enumerate(image_files, 1):
-            # Log progress and start time for this image
-            logger.info(f"Describing image {i} of {len(image_files)}: {image_path.name}")
+        def describe(i: int, batch: List[Path]):
+            # Log progress and start time for this image (or batch)
+            if len(batch) == 1:
+                logger.info(f"Describing image {i} of {len(image_files)}: {batch[0].name}")
+            else:
+                logger.info(f"Describing images {i}-{i + len(batch) - 1} of {len(image_files)} in one request")
             image_start_time = time.time()
             logger.info(f"Start time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(image_start_time))}")
 
             # Extract metadata from image
-            metadata = self.extract_metadata(image_path)
-            if metadata:
-                logger.debug(f"Extracted metadata for {image_path.name}: {metadata}")
-            else:
-                logger.debug(f"No metadata extracted for {image_path.name}")
+            metadata_list = []
+            for image_path in batch:
+                metadata = self.extract_metadata(image_path)
+                if metadata:
+                    logger.debug(f"Extracted metadata for {image_path.name}: {metadata}")
+                else:
+                    logger.debug(f"No metadata extracted for {image_path.name}")
+                metadata_list.append(metadata)
 
             # Get description from Ollama
-            description = self.get_image_description(image_path)
+            if len(batch) == 1:
+                descriptions = [self.get_image_description(batch[0])]
+            else:
+                descriptions = self.get_batch_descriptions(batch)
 
             # Log end time for this image
             image_end_time = time.time()
@@ -546,25 +658,52 @@ class ImageDescriber:
             logger.info(f"End time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(image_end_time))}")
             logger.info(f"Processing duration: {processing_duration:.2f} seconds")
 
-            if description:
-                # Write description to file with metadata and base directory for relative paths
-                if self.write_description_to_file(image_path, description, output_file, metadata, directory_path):
-                    success_count += 1
-                    # Log with relative path for better readability
-                    try:
-                        relative_path = image_path.relative_to(directory_path)
-                        logger.info(f"Successfully processed: {relative_path}")
-                    except ValueError:
-                        logger.info(f"Successfully processed: {image_path.name}")
-                else:
-                    logger.error(f"Failed to write description for: {image_path.name}")
-            else:
-                logger.error(f"Failed to generate description for: {image_path.name}")
+            return list(zip(metadata_list, descriptions))
 
-            # Memory management: add delay and force garbage collection
-            if self.batch_delay > 0:
-                time.sleep(self.batch_delay)
-            gc.collect()
+        # Group images into multi-image requests when --batch is above 1
+        starts = range(1, len(image_files) + 1, self.batch_size)
+        batches = [image_files[i - 1:i - 1 + self.batch_size] for i in starts]
+
+        # Requests are I/O-bound waits on the Ollama server, so threads let
+        # several be in flight at once. map() yields results in file order,
+        # so the output file is still written in order from this thread.
+        executor = None
+        if self.concurrency > 1:
+            executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            logger.info(f"Sending up to {self.concurrency} concurrent requests to Ollama")
+            results = chain.from_iterable(executor.map(describe, starts, batches))
+        else:
+            results = chain.from_iterable(map(describe, starts, batches))
+
+        try:
+            # Keep one append handle open for the whole run
+            with open(output_file, 'a', encoding='utf-8') as out:
+                for image_path, (metadata, description) in zip(image_files, results):
+                    if description:
+                        # Write description to file with metadata and base directory for relative paths
+                        if self.write_description_to_file(image_path, description, output_file, metadata, directory_path,
+                                                          output_handle=out):
+                            success_count += 1
+                            # Log with relative path for better readability
+                            try:
+                                relative_path = image_path.relative_to(directory_path)
+                                logger.info(f"Successfully processed: {relative_path}")
+                            except ValueError:
+                                logger.info(f"Successfully processed: {image_path.name}")
+                        else:
+                            logger.error(f"Failed to write description for: {image_path.name}")
+                    else:
+                        logger.error(f"Failed to generate description for: {image_path.name}")
+
+                    # Memory management: add delay and force garbage collection.
+                    # The delay only throttles serial runs; concurrent runs are
+                    # bounded by --concurrency instead.
+                    if self.batch_delay > 0 and executor is None:
+                        time.sleep(self.batch_delay)
+                    gc.collect()
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # Log overall completion summary
         overall_end_time = time.time()
@@ -961,6 +1100,22 @@ Configuration:
         default=2.0,
         help="Delay between processing images in seconds (default: 2.0)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of images to send to Ollama concurrently (default: 1; set OLLAMA_NUM_PARALLEL on the server to match)"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Number of images to describe per multi-image request (default: 1; falls back to single-image requests if the reply can't be split)"
+    )
+    parser.add_argument(
+        "--env-cache",
+        help="JSON file with a \"models\" list from a previous discovery; skips the Ollama model check"
+    )
     parser.add_argument(
         "--max-files",
         type=int,
@@ -1016,7 +1171,9 @@ Configuration:
         batch_delay=args.batch_delay,
         config_file=args.config,
         prompt_style=args.prompt_style,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        concurrency=args.concurrency,
+        batch_size=args.batch
     )
 
     # Override metadata extraction if disabled via command line
@@ -1051,28 +1208,39 @@ Configuration:
         sys.exit(0)
         describer.config['output_format']['include_metadata'] = False
 
-    # Check if Ollama is available
-    try:
-        ollama.list()
-        logger.info("Ollama is available")
-    except Exception as e:
-        logger.error(f"Ollama is not available or not running: {e}")
-        logger.error("Please make sure Ollama is installed and running")
-        sys.exit(1)
-
-    # Check if the specified model is available
-    try:
-        models = ollama.list()
-        available_models = [model['name'] for model in models.get('models', [])]
-        if describer.model_name not in available_models:
-            logger.error(f"Model '{describer.model_name}' is not available")
-            logger.error(f"Available models: {', '.join(available_models)}")
-            logger.info(f"You can install the model with: ollama pull {describer.model_name}")
+    # A parent run (comprehensive_test.py) may already have listed the models;
+    # trust its list instead of querying Ollama again for every run
+    cached_models = None
+    if args.env_cache:
+        try:
+            with open(args.env_cache, 'r', encoding='utf-8') as f:
+                cached_models = json.load(f).get('models')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read environment cache {args.env_cache}: {e}")
+
+    if cached_models and describer.model_name in cached_models:
+        logger.info(f"Using model: {describer.model_name} (from environment cache)")
+    else:
+        # Check that Ollama is available and the specified model is installed
+        try:
+            models = ollama.list()
+            logger.info("Ollama is available")
+        except Exception as e:
+            logger.error(f"Ollama is not available or not running: {e}")
+            logger.error("Please make sure Ollama is installed and running")
             sys.exit(1)
-        else:
-            logger.info(f"Using model: {describer.model_name}")
-    except Exception as e:
-        logger.warning(f"Could not check available models: {e}")
+
+        try:
+            available_models = [model['name'] for model in models.get('models', [])]
+            if describer.model_name not in available_models:
+                logger.error(f"Model '{describer.model_name}' is not available")
+                logger.error(f"Available models: {', '.join(available_models)}")
+                logger.info(f"You can install the model with: ollama pull {describer.model_name}")
+                sys.exit(1)
+            else:
+                logger.info(f"Using model: {describer.model_name}")
+        except Exception as e:
+            logger.warning(f"Could not check available models: {e}")
 
     # Process the directory
     try:
@@ -357,6 +357,9 @@ class WorkflowOrchestrator:
             if not step_config.get("keep_metadata", True):
                 cmd.append("--no-metadata")
 
+            if step_config.get("optimize", False):
+                cmd.append("--optimize")
+
             self.logger.info(f"Running: {' '.join(cmd)}")
             result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
 
@@ -456,6 +459,12 @@ class WorkflowOrchestrator:
                 if "model" in step_config and step_config["model"]:
                     cmd.extend(["--model", step_config["model"]])
 
+                if step_config.get("concurrency", 1) > 1:
+                    cmd.extend(["--concurrency", str(step_config["concurrency"])])
+
+                if step_config.get("env_cache"):
+                    cmd.extend(["--env-cache", step_config["env_cache"]])
+
                 # Handle prompt style - use config file default if not explicitly set
                 if "prompt_style" in step_config and step_config["prompt_style"]:
                     cmd.extend(["--prompt-style", step_config["prompt_style"]])
@@ -831,6 +840,11 @@ Examples:
         help="Override prompt style for image description"
     )
 
+    parser.add_argument(
+        "--env-cache",
+        help="JSON file with already-discovered Ollama models; skips the model check in image_describer.py"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -916,6 +930,9 @@ Examples:
         if args.prompt_style:
             orchestrator.config.config["workflow"]["steps"]["image_description"]["prompt_style"] = args.prompt_style
 
+        if args.env_cache:
+            orchestrator.config.config["workflow"]["steps"]["image_description"]["env_cache"] = args.env_cache
+
         # Set logging level
         if args.verbose:
             orchestrator.logger.logger.setLevel(logging.DEBUG)
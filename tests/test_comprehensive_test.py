@@ -0,0 +1,200 @@
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import comprehensive_test
+
+
+def _result(model, prompt, success, **extra):
+    start = datetime(2025, 7, 28, 14, 30, 22, 123456)
+    result = {
+        'model': model,
+        'prompt': prompt,
+        'start_time': start,
+        'end_time': start + timedelta(seconds=12.5),
+        'duration': 12.5,
+        'success': success,
+        'error_message': None if success else 'Timeout after 30 minutes',
+        'output_dir': f'/out/{model}_{prompt}',
+        'created_files': {
+            'descriptions': success, 'html_reports': success, 'extracted_frames': False,
+            'converted_images': False, 'logs': True, 'description_file_size': 42,
+            'html_file_count': 1, 'frame_count': 0, 'converted_count': 0,
+        },
+    }
+    result.update(extra)
+    return result
+
+
+def test_checkpoint_line_round_trip():
+    result = _result('llava:7b', 'detailed', True, error_message='naïve "quoted"\nline ✅')
+    line = comprehensive_test._checkpoint_line(result)
+    assert line.endswith('\n') and line.count('\n') == 1
+    assert comprehensive_test._parse_checkpoint_line(line) == result
+
+
+def test_parse_checkpoint_line_rejects_truncated_line():
+    line = comprehensive_test._checkpoint_line(_result('m', 'p', True))
+    with pytest.raises(ValueError):
+        comprehensive_test._parse_checkpoint_line(line[:len(line) // 2])
+
+
+def test_resume_retries_failed_combinations(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    output = tmp_path / "out"
+    output.mkdir()
+    with open(output / comprehensive_test._CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
+        f.write(comprehensive_test._checkpoint_line(_result('m1', 'a', True)))
+        f.write(comprehensive_test._checkpoint_line(_result('m1', 'b', False)))
+
+    tester = comprehensive_test.ComprehensiveTester(str(images), str(output))
+    tester.discover_models = lambda: ['m1']
+    tester.discover_prompt_styles = lambda: ['a', 'b']
+    tester.prepare_shared_inputs = lambda: None
+    tester.get_worker_count = lambda: 1
+    tester.evict_model = lambda model: None
+    tester.generate_reports = lambda: None
+    ran = []
+
+    def run_combination(model, prompt):
+        ran.append((model, prompt))
+        return _result(model, prompt, True)
+    tester.run_combination = run_combination
+
+    tester.run_comprehensive_test()
+
+    assert ran == [('m1', 'b')]
+    assert [(r['prompt'], r['success']) for r in tester.results] == [('a', True), ('b', True)]
+
+
+SAMPLE_DESCRIPTIONS = os.path.join(os.path.dirname(__file__), 'test_files', 'comprehensive_descriptions.txt')
+
+
+def test_done_marker_is_not_checkpointed_again(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    output = tmp_path / "out"
+    (output / "m1_a").mkdir(parents=True)
+    (output / "m1_a" / comprehensive_test._DONE_FILE).write_text(
+        comprehensive_test._checkpoint_line(_result('m1', 'a', True)), encoding='utf-8')
+
+    tester = comprehensive_test.ComprehensiveTester(str(images), str(output))
+    tester.discover_models = lambda: ['m1']
+    tester.discover_prompt_styles = lambda: ['a']
+    tester.prepare_shared_inputs = lambda: None
+    tester.get_worker_count = lambda: 1
+    tester.evict_model = lambda model: None
+    tester.generate_reports = lambda: None
+
+    tester.run_comprehensive_test()
+
+    assert [r['prompt'] for r in tester.results] == ['a']
+    assert '_from_done' not in tester.results[0]
+    assert tester.load_checkpoint() == []
+
+
+def test_discovery_is_cached_per_tester(tmp_path):
+    calls = []
+
+    def make_tester():
+        tester = comprehensive_test.ComprehensiveTester(str(tmp_path), str(tmp_path / "out"))
+        tester._list_models = lambda: calls.append(1) or ['m1']
+        return tester
+
+    tester = make_tester()
+    assert tester.discover_models() == ['m1']
+    assert tester.discover_models() == ['m1']
+    assert len(calls) == 1
+
+    # A second tester asks Ollama again rather than sharing the first's list
+    assert make_tester().discover_models() == ['m1']
+    assert len(calls) == 2
+
+
+def test_compile_descriptions_to_json_parses_sample_file(monkeypatch, tmp_path):
+    desc_dir = tmp_path / "custom_results" / "llava_latest_detailed" / "descriptions"
+    desc_dir.mkdir(parents=True)
+    shutil.copyfile(SAMPLE_DESCRIPTIONS, desc_dir / "image_descriptions.txt")
+    # compile_descriptions_to_json looks for custom_results/ next to the script
+    monkeypatch.setattr(comprehensive_test, '__file__', str(tmp_path / "comprehensive_test.py"))
+    images = tmp_path / "images"
+    images.mkdir()
+    tester = comprehensive_test.ComprehensiveTester(str(images), str(tmp_path / "out"))
+
+    output = tmp_path / "compiled.json"
+    tester.compile_descriptions_to_json(str(output))
+    records = json.loads(output.read_text(encoding='utf-8'))
+
+    descriptions = {
+        record['file_path']: record['prompt_styles'][0]['models'][0]['description']
+        for record in records
+    }
+    # Descriptions run to the next line starting with '---', '===' or
+    # 'File: ', Timestamp line included; entries without a Path line are skipped
+    assert descriptions == {
+        '/photos/red_square.jpg': 'A vibrant red square with white text reading "Red Square".\n'
+                                  'Timestamp: 2025-07-28 14:30:40',
+        '/photos/trip/beach.jpg': 'A beach at sunset.\n\nDetails: the sky is orange, waves roll in.',
+        '/photos/empty.jpg': 'Timestamp: 2025-07-28 14:31:33',
+        '/photos/last.jpg': 'The final entry, with no timestamp or separator after it.',
+    }
+    assert records[0]['prompt_styles'][0]['style'] == 'detailed'
+    assert records[0]['prompt_styles'][0]['models'][0]['model'] == 'llava'
+
+
+def test_read_sample_descriptions_parses_sample_file():
+    samples = comprehensive_test._read_sample_descriptions(SAMPLE_DESCRIPTIONS)
+    # Like the line-based parser it replaced, a sample runs from the
+    # Description line to the next File line or 16+ character separator, so
+    # trailing Timestamp lines and short '---' lines are kept
+    assert samples == {
+        'red_square.jpg': 'A vibrant red square with white text reading "Red Square".\n'
+                          'Timestamp: 2025-07-28 14:30:40',
+        'trip/beach.jpg': 'A beach at sunset.\n\nDetails: the sky is orange, waves roll in.\n---\n'
+                          'File names and dashes inside the text stay part of it.\n'
+                          'Timestamp: 2025-07-28 14:31:02',
+        'no_path.png': 'An entry written without a Path line.\nTimestamp: 2025-07-28 14:31:20',
+        'empty.jpg': 'Timestamp: 2025-07-28 14:31:33',
+        'last.jpg': 'The final entry, with no timestamp or separator after it.',
+    }
+
+
+def test_read_sample_descriptions_missing_or_empty_file(tmp_path):
+    assert comprehensive_test._read_sample_descriptions(str(tmp_path / "missing.txt")) == {}
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert comprehensive_test._read_sample_descriptions(str(empty)) == {}
+
+
+@pytest.mark.parametrize("row", [
+    ("llava:7b", "detailed", True, 12.5, None, 0),
+    ("a,b", 'say "hi"', False, 0.1, "line one\nline two", ""),
+    ("carriage\rreturn", "trailing space ", None, 1e-07, "'single'", 1 / 3),
+    comprehensive_test._CSV_HEADER,
+])
+def test_csv_line_matches_csv_writer(row):
+    expected = io.StringIO()
+    csv.writer(expected).writerow(row)
+    assert comprehensive_test._csv_line(row) == expected.getvalue()
+
+
+@pytest.mark.parametrize("host, expected", [
+    (None, "http://127.0.0.1:11434"),
+    ("0.0.0.0", "http://0.0.0.0:11434"),
+    ("myhost", "http://myhost:11434"),
+    ("myhost:1234", "http://myhost:1234"),
+    ("http://myhost", "http://myhost:80"),
+    ("https://myhost", "https://myhost:443"),
+    ("http://localhost:11434", "http://localhost:11434"),
+    ("example.com:56789/path/", "http://example.com:56789/path"),
+])
+def test_ollama_base_url_matches_ollama_client(host, expected):
+    assert comprehensive_test._ollama_base_url(host) == expected
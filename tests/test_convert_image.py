@@ -28,29 +28,25 @@ def test_convert_heic_to_jpg_invalid_path(tmp_path):
     result = ConvertImage.convert_heic_to_jpg(str(input_path))
     assert result is None or isinstance(result, str) or isinstance(result, bool)
 
-def test_convert_heic_to_jpg_valid_file(monkeypatch, tmp_path):
-    # Simulate a valid HEIC file conversion
+def test_convert_heic_to_jpg_valid_file(tmp_path):
+    # Convert a real (tiny) HEIC file
+    from PIL import Image
     input_path = tmp_path / "test.heic"
-    input_path.write_bytes(b"fakeheicdata")
+    Image.new("RGB", (16, 16), (200, 10, 10)).save(input_path)
     output_path = tmp_path / "output.jpg"
 
-    def fake_open_heic(path):
-        class FakeHeic:
-            def save(self, out_path, format, quality):
-                Path(out_path).write_bytes(b"fakejpgdata")
-        return FakeHeic()
-    monkeypatch.setattr(ConvertImage, "open_heic", fake_open_heic)
     result = ConvertImage.convert_heic_to_jpg(str(input_path), str(output_path))
-    assert output_path.exists()
-    assert result is not None
+    assert result is True
+    with Image.open(output_path) as converted:
+        assert converted.format == "JPEG"
+        assert converted.size == (16, 16)
 
 def test_convert_directory_empty(monkeypatch, tmp_path):
     # Should handle empty directory gracefully
     output_dir = tmp_path / "out"
     output_dir.mkdir()
     result = ConvertImage.convert_directory(str(tmp_path), str(output_dir))
-    assert isinstance(result, list)
-    assert len(result) == 0
+    assert result == (0, 0)
 
 def test_convert_directory_with_files(monkeypatch, tmp_path):
     # Simulate directory with HEIC files
@@ -59,13 +55,51 @@ def test_convert_directory_with_files(monkeypatch, tmp_path):
     output_dir = tmp_path / "out"
     output_dir.mkdir()
 
-    def fake_convert_heic_to_jpg(input_path, output_path=None, quality=95, keep_metadata=True):
+    def fake_convert_heic_to_jpg(input_path, output_path=None, *args, **kwargs):
         Path(output_path).write_bytes(b"fakejpgdata")
-        return output_path
+        return True
     monkeypatch.setattr(ConvertImage, "convert_heic_to_jpg", fake_convert_heic_to_jpg)
     result = ConvertImage.convert_directory(str(tmp_path), str(output_dir))
-    assert isinstance(result, list)
-    assert any(str(output_dir) in str(r) for r in result)
+    assert result == (1, 0)
+    assert (output_dir / "img1.jpg").exists()
+
+def test_convert_heic_to_jpg_writes_rgb_for_grayscale_input(tmp_path):
+    from PIL import Image
+    input_path = tmp_path / "gray.heic"
+    Image.new("L", (16, 16), 128).save(input_path)
+    output_path = tmp_path / "gray.jpg"
+
+    assert ConvertImage.convert_heic_to_jpg(str(input_path), str(output_path)) is True
+    with Image.open(output_path) as converted:
+        assert converted.mode == "RGB"
+
+def test_iter_heic_matches_extensions_case_insensitively(tmp_path):
+    (tmp_path / "a.heic").write_bytes(b"x")
+    (tmp_path / "b.HEIC").write_bytes(b"x")
+    (tmp_path / "c.heif").write_bytes(b"x")
+    (tmp_path / "d.jpg").write_bytes(b"x")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "e.HeIf").write_bytes(b"x")
+
+    flat = sorted(p.name for p in ConvertImage._iter_heic(tmp_path))
+    assert flat == ["a.heic", "b.HEIC", "c.heif"]
+
+    deep = sorted(p.name for p in ConvertImage._iter_heic(tmp_path, recursive=True))
+    assert deep == ["a.heic", "b.HEIC", "c.heif", "e.HeIf"]
+
+def test_iter_heic_does_not_follow_directory_symlinks(tmp_path):
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "a.heic").write_bytes(b"x")
+    try:
+        (sub / "loop").symlink_to(tmp_path, target_is_directory=True)
+        (tmp_path / "link.heic").symlink_to(sub / "a.heic")
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    deep = sorted(p.name for p in ConvertImage._iter_heic(tmp_path, recursive=True))
+    assert deep == ["a.heic", "link.heic"]
 
 def test_main_help(monkeypatch, capsys):
     # Simulate running main with --help
@@ -88,5 +122,14 @@ def test_main_directory(monkeypatch, tmp_path):
     heic_file = tmp_path / "img1.heic"
     heic_file.write_bytes(b"fakeheicdata")
     monkeypatch.setattr("sys.argv", ["ConvertImage.py", str(tmp_path)])
-    monkeypatch.setattr(ConvertImage, "convert_directory", lambda directory_path, **kwargs: [str(tmp_path / "img1.jpg")])
+    monkeypatch.setattr(ConvertImage, "convert_directory", lambda directory_path, **kwargs: (1, 0))
     ConvertImage.main()
+
+@pytest.mark.parametrize("option", ["--jobs", "--max-dimension"])
+@pytest.mark.parametrize("value", ["0", "-2", "x"])
+def test_main_rejects_non_positive_counts(monkeypatch, capsys, tmp_path, option, value):
+    monkeypatch.setattr("sys.argv", ["ConvertImage.py", str(tmp_path), option, value])
+    with pytest.raises(SystemExit) as exc:
+        ConvertImage.main()
+    assert exc.value.code == 2
+    assert option in capsys.readouterr().err
@@ -60,6 +60,13 @@ class TestImageDescriber(unittest.TestCase):
             self.assertIsInstance(desc, str)
             self.assertIn("sunset", desc)
 
+    def test_split_batch_response(self):
+        reply = "Here you go.\nIMAGE 1: A red barn.\n\n**IMAGE 2:** A blue lake.\nWith hills."
+        parts = ImageDescriber._split_batch_response(reply, 2)
+        self.assertEqual(parts, ["A red barn.", "A blue lake.\nWith hills."])
+        self.assertIsNone(ImageDescriber._split_batch_response("IMAGE 1: only one", 2))
+        self.assertIsNone(ImageDescriber._split_batch_response("no markers at all", 1))
+
     @patch("builtins.open", new_callable=unittest.mock.mock_open)
     def test_write_description_to_file(self, mock_open):
         result = self.describer.write_description_to_file(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
-"""Workflow wrapper - forwards calls to scripts/workflow.py"""
+"""Workflow wrapper - runs scripts/workflow.py in this interpreter"""
+import importlib.util
 import os
-import subprocess
 import sys
 
 root_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,8 +9,15 @@ scripts_dir = os.path.join(root_dir, "scripts")
 workflow_script = os.path.join(scripts_dir, "workflow.py")
 original_cwd = os.getcwd()
 
-args_with_cwd = ['--original-cwd', original_cwd] + sys.argv[1:]
-cmd = [sys.executable, workflow_script] + args_with_cwd
+# The workflow resolves its config files and helper scripts relative to the
+# scripts directory, so run from there as the subprocess wrapper used to
+sys.path.insert(0, scripts_dir)
+os.chdir(scripts_dir)
+sys.argv = [workflow_script, '--original-cwd', original_cwd] + sys.argv[1:]
 
-result = subprocess.run(cmd, cwd=scripts_dir)
-sys.exit(result.returncode)
+# Load by path: this wrapper is also named workflow.py
+spec = importlib.util.spec_from_file_location("_idt_workflow", workflow_script)
+workflow = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(workflow)
+
+sys.exit(workflow.main() or 0)